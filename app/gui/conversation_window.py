@@ -3,6 +3,7 @@
 """
 
 import flet as ft
+import os
 import sys
 import time
 import threading
@@ -11,16 +12,15 @@ import json
 import re
 import traceback
 from collections import deque
-from typing import Any
+from typing import Any, Coroutine
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 from numpy.typing import NDArray
 import sounddevice as sd
 import asyncio
+import concurrent.futures
 import aiofiles
-from pydub import AudioSegment
-import scipy.io.wavfile as wavfile
 from app.services.audio_service import AudioService
 from app.services.api_check_service import APICheckService
 from app.services.storage_service import LocalStorageService
@@ -28,11 +28,158 @@ from app.services.realtime_service import RealtimeService
 from app.services.evaluation_service import EvaluationService
 from app.services.search_service import SearchService
 from app.gui.result_window import ResultWindow
+from app.utils.log_queue import get_queued_logger
+from app.utils.waveform import (
+    level_buffer_to_points,
+    levels_unchanged,
+    normalize_levels,
+    values_to_points,
+)
+
+try:
+    from numba import njit
+except ImportError:  # numbaは任意依存（未インストール時はNumPy実装を使用）
+    njit = None
+
+
+def _gain_clip_i16_loop(buf: NDArray[np.int16], gain: int) -> None:
+    """int16バッファにゲインを掛けてクリップする（インプレース、Numba用ループ実装）"""
+    for i in range(buf.size):
+        v = np.int32(buf[i]) * gain
+        if v > 32767:
+            v = 32767
+        elif v < -32768:
+            v = -32768
+        buf[i] = v
+
+
+def _gain_clip_i16_numpy(buf: NDArray[np.int16], gain: int) -> None:
+    """int16バッファにゲインを掛けてクリップする（インプレース、NumPy実装）"""
+    widened = buf.astype(np.int32)
+    widened *= gain
+    np.clip(widened, -32768, 32767, out=widened)
+    buf[:] = widened
+
+
+# numbaが利用可能な場合はJITコンパイルしたループを使用
+# 型シグネチャを指定してimport時にコンパイルする（初回呼び出しは音声コールバック内のため）
+_gain_clip_i16 = (
+    njit("void(int16[:], int64)", cache=True)(_gain_clip_i16_loop)
+    if njit is not None
+    else _gain_clip_i16_numpy
+)
+
+
+def _concat_pcm_chunks(
+    chunks: list[NDArray[np.int16]], total_samples: int | None = None
+) -> NDArray[np.int16]:
+    """16bit PCM音声チャンク列を1本の配列に連結する
+
+    録音時にint16のまま保持しているため、保存時の変換は不要。
+    事前確保した配列へチャンクを順にコピーする。
+
+    Args:
+        chunks: int16音声チャンクのリスト
+        total_samples: 総サンプル数（録音時に集計済みの場合に指定、省略時は計算）
+    """
+    if total_samples is None:
+        total_samples = sum(chunk.size for chunk in chunks)
+    pcm = np.empty(total_samples, dtype=np.int16)
+    offset = 0
+    for chunk in chunks:
+        n = chunk.size
+        pcm[offset : offset + n] = chunk.reshape(-1)
+        offset += n
+    return pcm
+
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存（未インストール時は標準のjsonを使用）
+    orjson = None
+
+
+def _dumps_json_bytes(data: Any) -> bytes:
+    """データをインデント付きJSON（UTF-8バイト列）に変換する"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+try:
+    import daz
+except ImportError:  # dazは任意依存（未インストール時はFTZ/DAZを設定しない）
+    daz = None
+
+# FTZ/DAZを設定済みかどうか（MXCSRはスレッドごとのため、スレッドローカルで管理）
+_denormal_state = threading.local()
+
+
+def _enable_ftz_daz() -> None:
+    """現在のスレッドでFTZ/DAZ（非正規化数のゼロ扱い）を有効化する"""
+    if daz is None or getattr(_denormal_state, "enabled", False):
+        return
+    try:
+        daz.set_ftz()
+        daz.set_daz()
+    except Exception as e:
+        # 音声コールバック内で呼ばれるため、標準出力ではなくキュー経由のロガーに出す
+        _audio_log.warning("FTZ/DAZ設定エラー（無視可能）: %s", e)
+    _denormal_state.enabled = True
+
+
+# 音声コールバック用のロガー
+# コールバックスレッドではキューに積むだけにして、出力は別スレッドのリスナーで行う
+_audio_log = get_queued_logger(f"{__name__}.audio")
+
+
+# 評価・保存処理用のバックグラウンドイベントループ（プロセスで1つを共有）
+# 画面は戻る・新規セッションのたびに作り直されるため、画面ごとには持たない
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock: threading.Lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """共有のバックグラウンドイベントループを取得（未起動なら専用スレッドで起動）"""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="background-loop", daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def _log_background_exception(future: concurrent.futures.Future) -> None:
+    """バックグラウンドで実行したコルーチンの例外を出力する"""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        print(f"バックグラウンド処理エラー: {str(exc)}")
+        traceback.print_exception(exc)
+
+
+# スコア折れ線グラフの系列順（0: grammar, 1: vocabulary, 2: naturalness, 3: fluency, 4: overall）
+_SCORE_SERIES_KEYS: tuple[str, ...] = (
+    "grammar",
+    "vocabulary",
+    "naturalness",
+    "fluency",
+    "overall",
+)
+
+# スコア折れ線グラフに表示する評価回数の上限（これより古い評価は描画しない）
+_SCORE_CHART_VISIBLE_WINDOW: int = 100
 
 
 class ConversationWindow:
     """会話画面のウィンドウクラス"""
 
+    # 保存先ディレクトリ・日付ごとの最終レコード番号（アプリ起動中は画面を作り直しても共有）
+    record_folder_counters: dict[tuple[Path, str], int] = {}
+
     def __init__(
         self,
         page: ft.Page,
@@ -89,9 +236,14 @@ class ConversationWindow:
         self.recorded_audio: list[float] | None = None
 
         # リアルタイム波形表示用（メイン画面用）
-        self.mic_waveform_buffer: list[float] = []
-        self.speaker_waveform_buffer: list[float] = []
+        # 上限を超えた古い値はdequeが自動的に破棄する
         self.max_buffer_size: int = 200
+        self.mic_waveform_buffer: deque[float] = deque(maxlen=self.max_buffer_size)
+        self.speaker_waveform_buffer: deque[float] = deque(
+            maxlen=self.max_buffer_size
+        )
+        # 最後にマイク波形チャートへ送信した値（変化がない場合の再送防止用）
+        self.last_pushed_mic_levels: NDArray[np.float64] | None = None
         self.last_update_time: float = 0.0
         self.update_interval: float = 0.05
 
@@ -171,7 +323,9 @@ class ConversationWindow:
         )
         self.teacher_image: ft.Image | None = None  # 講師の3Dモデル画像
         self.student_waveform_chart: ft.LineChart | None = None  # 学生用の音声波形
-        self.student_waveform_buffer: list[float] = []  # 学生用波形バッファ
+        self.student_waveform_buffer: deque[float] = deque(
+            maxlen=self.max_buffer_size
+        )  # 学生用波形バッファ
         self.conversation_session_duration_minutes: int = (
             3  # 会話セッションの時間（分） - 開発用に調整可能
         )
@@ -202,6 +356,9 @@ class ConversationWindow:
         # 10 chunks ≈ 430ms のバッファを保持
         self.audio_pre_buffer: deque = deque(maxlen=10)
 
+        # 増幅処理用のint16スクラッチバッファ（コールバック毎の確保を避ける）
+        self.student_pcm_scratch: NDArray[np.int16] = np.zeros(1024, dtype=np.int16)
+
         # 会話履歴の記録
         self.conversation_history: list[
             dict[str, str]
@@ -219,6 +376,11 @@ class ConversationWindow:
             dict[str, float]
         ] = []  # [{"grammar": 80, "vocabulary": 75, "naturalness": 70, "fluency": 85, "overall": 77.5}, ...]
         self.score_chart: ft.LineChart | None = None  # スコア折れ線グラフ
+        self.score_series_points: list[list[ft.LineChartDataPoint]] = [
+            [] for _ in _SCORE_SERIES_KEYS
+        ]  # 折れ線グラフに描画済みのデータポイント（系列ごと、差分追加用）
+        # 会話テストタブが非表示の間に保留したグラフ更新があるかどうか
+        self.score_chart_dirty: bool = False
         self.evaluation_feedback_text: ft.Text = ft.Text(
             "",
             size=18,
@@ -227,16 +389,18 @@ class ConversationWindow:
             weight=ft.FontWeight.BOLD,
         )  # 評価スコアと講評を表示するテキスト（画面下）
 
-        # 音声録音用のバッファ（保存用）
+        # 音声録音用のバッファ（保存用、受信・録音時の16bit PCMのまま保持）
         self.ai_audio_recording_buffer: list[
-            NDArray[np.floating]
+            NDArray[np.int16]
         ] = []  # AI音声録音バッファ
+        self.ai_audio_total_samples: int = 0  # AI音声録音バッファの総サンプル数
         self.ai_audio_recording_lock: threading.Lock = (
             threading.Lock()
         )  # 録音バッファアクセス用ロック
         self.student_audio_recording_buffer: list[
-            NDArray[np.floating]
+            NDArray[np.int16]
         ] = []  # 学生音声録音バッファ
+        self.student_audio_total_samples: int = 0  # 学生音声録音バッファの総サンプル数
         self.student_audio_recording_lock: threading.Lock = (
             threading.Lock()
         )  # 録音バッファアクセス用ロック
@@ -264,6 +428,43 @@ class ConversationWindow:
         # 画面がアクティブかどうかのフラグ（非同期処理からのUI更新制御用）
         self.is_active: bool = True
 
+        # UI更新の要求がまとめ待ち中かどうか（_request_update用）
+        self.update_pending: bool = False
+
+    def _request_update(self) -> None:
+        """UI更新を要求する（連続した要求は1回のpage.update()にまとめる）
+
+        どのスレッドから呼び出してもよい。
+        """
+        if self.update_pending:
+            return
+        self.update_pending = True
+        try:
+            self.page.run_task(self._flush_update)
+        except Exception:
+            # イベントループが使えない場合は直接更新する
+            self.update_pending = False
+            self.page.update()
+
+    async def _flush_update(self) -> None:
+        """まとめ待ち中のUI更新を反映する"""
+        # 同じ周回で要求された更新をまとめるため1周待つ
+        await asyncio.sleep(0)
+        self.update_pending = False
+        self.page.update()
+
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """評価・保存用のバックグラウンドイベントループを取得（プロセスで1つを共有）"""
+        return _get_background_loop()
+
+    def _run_in_background(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """コルーチンをバックグラウンドループで実行する（結果は待たない）
+
+        待たずに捨てるFutureの例外が失われないよう、完了時にログに出す。
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_background_loop())
+        future.add_done_callback(_log_background_exception)
+
     def _show_evaluating_overlay(self, message: str) -> None:
         """評価中のオーバーレイを表示（画面全体を覆って操作不能にする）"""
 
@@ -578,8 +779,7 @@ class ConversationWindow:
                 expand=True,
             )
         )
-
-        self.page.update()
+        # page.add()が画面を反映するため、ここで改めてupdate()は呼ばない
 
     def _create_tabs(self) -> ft.Tabs:
         """タブコンポーネントの作成"""
@@ -618,40 +818,55 @@ class ConversationWindow:
         self._start_realtime_monitoring()
 
     def _check_apis(self) -> None:
-        """APIの状態をチェック"""
-        api_results = self.api_check_service.check_all_apis()
+        """APIの状態をチェック（バックグラウンドで実行し、UIをブロックしない）"""
+        self.page.run_task(self._check_apis_async)
 
-        for api_result in api_results:
-            if api_result["name"] in self.api_status_texts:
-                status_text = self.api_status_texts[api_result["name"]]
-                status_text.value = (
-                    f"{api_result['name']}の状態：{api_result['status']}"
-                )
+    async def _check_apis_async(self) -> None:
+        """各APIを並列にチェックし、応答があったものから表示を更新"""
 
-                # 状態に応じて色を変更
-                if api_result["status"] == "利用可能":
-                    status_text.color = ft.colors.GREEN
-                elif api_result["status"] == "エラー":
-                    status_text.color = ft.colors.RED
-                else:
-                    status_text.color = ft.colors.ORANGE
+        async def check_one(name: str) -> None:
+            api_result = await asyncio.to_thread(
+                self.api_check_service.check_api, name
+            )
+            self._apply_api_result(api_result)
+            self._request_update()
 
-        self.page.update()
+        await asyncio.gather(
+            *(check_one(name) for name in list(self.api_status_texts))
+        )
+
+    def _apply_api_result(self, api_result: dict[str, str]) -> None:
+        """APIチェック結果をステータステキストに反映"""
+        if api_result["name"] not in self.api_status_texts:
+            return
+
+        status_text = self.api_status_texts[api_result["name"]]
+        status_text.value = f"{api_result['name']}の状態：{api_result['status']}"
+
+        # 状態に応じて色を変更
+        if api_result["status"] == "利用可能":
+            status_text.color = ft.colors.GREEN
+        elif api_result["status"] == "エラー":
+            status_text.color = ft.colors.RED
+        else:
+            status_text.color = ft.colors.ORANGE
 
     def _start_realtime_monitoring(self) -> None:
         """リアルタイム波形監視を開始"""
         # マイクの監視を開始
         self.audio_service.start_mic_monitoring(self._on_mic_data_received)
 
-    def _on_mic_data_received(self, audio_data: list[float]) -> None:
+    def _on_mic_data_received(self, audio_data: NDArray[np.floating]) -> None:
         """マイクデータ受信時のコールバック"""
         try:
             # RMS値（実効値）を計算して波形の強度を取得
             if len(audio_data) > 0:
-                np_data: NDArray[np.floating] = np.array(audio_data, dtype=np.float32)
-                rms: float = float(np.sqrt(np.mean(np_data**2)))
+                # float32配列ならコピーしない
+                np_data: NDArray[np.floating] = np.asarray(audio_data, dtype=np.float32)
+                # np.dotで二乗和を計算（二乗の一時配列を作らない）
+                rms: float = float(np.sqrt(np.dot(np_data, np_data) / np_data.size))
                 # ピーク値も取得
-                peak: float = float(np.max(np.abs(np_data)))
+                peak: float = float(np.abs(np_data).max())
                 # より視覚的に分かりやすくするため、RMSとピークの平均を使用
                 value = (rms + peak) / 2.0
             else:
@@ -659,8 +874,6 @@ class ConversationWindow:
 
             # バッファに追加
             self.mic_waveform_buffer.append(value)
-            if len(self.mic_waveform_buffer) > self.max_buffer_size:
-                self.mic_waveform_buffer.pop(0)
 
             # 更新頻度を制限（一定間隔でのみ更新）
             current_time = time.time()
@@ -677,31 +890,28 @@ class ConversationWindow:
             return
 
         try:
-            # バッファからデータポイントを生成
-            data_points: list[ft.LineChartDataPoint] = []
             buffer_size = len(self.mic_waveform_buffer)
 
             if buffer_size > 0:
                 # バッファのデータをそのまま使用（時系列データとして表示）
-                for i, value in enumerate(self.mic_waveform_buffer):
-                    # 値の範囲を0.0～1.0に正規化（実際のRMS値は小さいので拡大）
-                    normalized_value = max(
-                        0.0, min(1.0, value * 10.0)
-                    )  # 10倍に拡大して視認性を向上
-                    data_points.append(ft.LineChartDataPoint(i, normalized_value))
+                # 値の範囲を0.0～1.0に正規化（実際のRMS値は小さいので10倍に拡大）
+                levels = normalize_levels(self.mic_waveform_buffer)
             else:
                 # データがない場合はゼロで埋める
-                data_points = [
-                    ft.LineChartDataPoint(i, 0.0) for i in range(self.max_buffer_size)
-                ]
+                levels = np.zeros(self.max_buffer_size, dtype=np.float64)
+
+            # 前回送信した波形からほとんど変化していない場合（無音時など）は送らない
+            if levels_unchanged(self.last_pushed_mic_levels, levels):
+                return
+            self.last_pushed_mic_levels = levels
 
             # チャートのX軸範囲を調整
             self.mic_chart.max_x = max(self.max_buffer_size, buffer_size)
 
             # データポイントを更新
             if self.mic_chart.data_series and len(self.mic_chart.data_series) > 0:
-                self.mic_chart.data_series[0].data_points = data_points
-                self.page.update()
+                self.mic_chart.data_series[0].data_points = values_to_points(levels)
+                self._request_update()
         except Exception as e:
             print(f"リアルタイムマイク波形更新エラー: {str(e)}")
 
@@ -727,13 +937,8 @@ class ConversationWindow:
                 audio_data = self.audio_service.record_audio(duration=3.0)
 
                 if len(audio_data) > 0:
-                    # 録音波形を表示（numpy配列をリストに変換）
-                    audio_list = (
-                        audio_data.tolist()
-                        if isinstance(audio_data, np.ndarray)
-                        else audio_data
-                    )
-                    self._update_mic_waveform(audio_list)
+                    # 録音波形を表示（numpy配列のまま渡す）
+                    self._update_mic_waveform(audio_data)
 
                     if self.status_text:
                         self.status_text.value = "再生中..."
@@ -745,14 +950,9 @@ class ConversationWindow:
                         audio_data, volume_gain=10.0
                     )
 
-                    # 再生波形を表示（増幅後のデータを使用）
+                    # 再生波形を表示（増幅後のデータをnumpy配列のまま使用）
                     if amplified_audio_data is not None:
-                        audio_list = (
-                            amplified_audio_data.tolist()
-                            if isinstance(amplified_audio_data, np.ndarray)
-                            else amplified_audio_data
-                        )
-                        self._update_speaker_waveform(audio_list)
+                        self._update_speaker_waveform(amplified_audio_data)
 
                     if self.status_text:
                         self.status_text.value = (
@@ -785,23 +985,27 @@ class ConversationWindow:
         test_thread = threading.Thread(target=test_audio, daemon=True)
         test_thread.start()
 
-    def _update_mic_waveform(self, audio_data: list[float] | None) -> None:
+    def _update_mic_waveform(
+        self, audio_data: NDArray[np.floating] | list[float] | None
+    ) -> None:
         """マイク波形の更新"""
-        if not self.mic_chart or not audio_data:
+        if not self.mic_chart or audio_data is None or len(audio_data) == 0:
             return
+        # 録音波形で上書きするため、次回のリアルタイム更新は必ず送信させる
+        self.last_pushed_mic_levels = None
 
         try:
             # データをサンプリングして表示
             data_length = len(audio_data)
             if data_length > 0:
                 # より多くのポイントを表示（200ポイント）
+                # NumPyで間引き・絶対値計算をまとめて行う（0から1の範囲）
+                samples = np.asarray(audio_data, dtype=np.float32)
                 step = max(1, data_length // self.max_buffer_size)
-                mic_points: list[ft.LineChartDataPoint] = []
-                for i in range(0, min(data_length, self.max_buffer_size * step), step):
-                    x = i // step
-                    # 振幅の絶対値を使用（0から1の範囲）
-                    y = abs(float(audio_data[i])) if i < data_length else 0.0
-                    mic_points.append(ft.LineChartDataPoint(x, y))
+                sampled = np.abs(samples[::step][: self.max_buffer_size])
+                mic_points: list[ft.LineChartDataPoint] = [
+                    ft.LineChartDataPoint(x, y) for x, y in enumerate(sampled.tolist())
+                ]
 
                 if not mic_points:
                     mic_points = [
@@ -814,25 +1018,28 @@ class ConversationWindow:
 
                 if self.mic_chart.data_series and len(self.mic_chart.data_series) > 0:
                     self.mic_chart.data_series[0].data_points = mic_points
-                    self.page.update()
+                    self._request_update()
         except Exception as e:
             print(f"マイク波形更新エラー: {str(e)}")
 
-    def _update_speaker_waveform(self, audio_data: list[float] | None) -> None:
+    def _update_speaker_waveform(
+        self, audio_data: NDArray[np.floating] | list[float] | None
+    ) -> None:
         """スピーカー波形の更新"""
-        if not self.speaker_chart or not audio_data:
+        if not self.speaker_chart or audio_data is None or len(audio_data) == 0:
             return
 
         try:
             # データをサンプリングして表示
             data_length = len(audio_data)
             if data_length > 0:
+                # NumPyで間引き・絶対値計算をまとめて行う
+                samples = np.asarray(audio_data, dtype=np.float32)
                 step = max(1, data_length // self.max_buffer_size)
-                speaker_points: list[ft.LineChartDataPoint] = []
-                for i in range(0, min(data_length, self.max_buffer_size * step), step):
-                    x = i // step
-                    y = abs(float(audio_data[i])) if i < data_length else 0.0
-                    speaker_points.append(ft.LineChartDataPoint(x, y))
+                sampled = np.abs(samples[::step][: self.max_buffer_size])
+                speaker_points: list[ft.LineChartDataPoint] = [
+                    ft.LineChartDataPoint(x, y) for x, y in enumerate(sampled.tolist())
+                ]
 
                 if not speaker_points:
                     speaker_points = [
@@ -850,7 +1057,7 @@ class ConversationWindow:
                     and len(self.speaker_chart.data_series) > 0
                 ):
                     self.speaker_chart.data_series[0].data_points = speaker_points
-                    self.page.update()
+                    self._request_update()
         except Exception as e:
             print(f"スピーカー波形更新エラー: {str(e)}")
 
@@ -1107,7 +1314,7 @@ class ConversationWindow:
                 self.global_status_text.color = status_text.color
 
         # 波形バッファを初期化
-        self.student_waveform_buffer = []
+        self.student_waveform_buffer.clear()
 
         # 評価スコアの折れ線グラフを作成
         self.score_chart = ft.LineChart(
@@ -1168,6 +1375,7 @@ class ConversationWindow:
 
         # 評価スコア履歴をリセット
         self.evaluation_scores_history = []
+        self.score_series_points = [[] for _ in _SCORE_SERIES_KEYS]
 
         content = ft.Container(
             content=ft.Row(
@@ -1615,8 +1823,8 @@ class ConversationWindow:
                 time.sleep(0.1)
 
                 new_window = ConversationWindow(self.page, save_dir=self.save_directory)
+                # build()内のpage.add()で画面が反映されるため追加のupdate()は不要
                 new_window.build()
-                self.page.update()
             except Exception as e:
                 print(f"メイン画面への復帰エラー: {e}")
                 # エラーが発生した場合でも、最低限のUIを表示するか、リトライを促す
@@ -1625,11 +1833,10 @@ class ConversationWindow:
                         f"画面の復帰中にエラーが発生しました: {e}", color=ft.colors.RED
                     )
                 )
-                self.page.update()
 
-        # 結果画面へ遷移
+        # 結果画面へ遷移（読み込み中表示を先に出し、構築はバックグラウンドで行う）
         result_window = ResultWindow(self.page, result_data, on_back)
-        result_window.build()
+        self.page.run_task(result_window.build_async)
 
     def _create_api_section(self) -> ft.Container:
         """APIチェックセクションの作成"""
@@ -1641,30 +1848,25 @@ class ConversationWindow:
             color=ft.colors.BLACK,
         )
 
-        # APIステータス表示用のテキスト
-        openai_status = ft.Text(
-            "OpenAI APIの状態：確認中...",
-            size=14,
-            color=ft.colors.BLACK,
-        )
-
-        openrouter_status = ft.Text(
-            "OpenRouter APIの状態：確認中...",
-            size=14,
-            color=ft.colors.BLACK,
-        )
-
-        self.api_status_texts["OpenAI API"] = openai_status
-        self.api_status_texts["OpenRouter API"] = openrouter_status
+        # APIステータス表示用のテキスト（チェック結果が届くまでは確認中と表示）
+        api_status_widgets: list[ft.Control] = []
+        for api_name in APICheckService.API_NAMES:
+            status_text = ft.Text(
+                f"{api_name}の状態：確認中...",
+                size=14,
+                color=ft.colors.BLACK,
+            )
+            self.api_status_texts[api_name] = status_text
+            if api_status_widgets:
+                api_status_widgets.append(ft.Container(height=5))
+            api_status_widgets.append(status_text)
 
         return ft.Container(
             content=ft.Column(
                 [
                     api_title,
                     ft.Container(height=10),
-                    openai_status,
-                    ft.Container(height=5),
-                    openrouter_status,
+                    *api_status_widgets,
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
@@ -1867,6 +2069,9 @@ class ConversationWindow:
             if self.evaluation_feedback_text:
                 self.evaluation_feedback_text.visible = False
             self.page.update()
+        elif self.score_chart_dirty:
+            # 非表示中に保留していたスコアグラフの更新を1回で反映
+            self._update_score_chart()
 
         # その他のテスト項目の場合は何もしない（ボタンクリック時のみ開始）
 
@@ -2184,11 +2389,14 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
             self.evaluation_request_count = 0
             # 評価スコア履歴をリセット
             self.evaluation_scores_history = []
+            self.score_series_points = [[] for _ in _SCORE_SERIES_KEYS]
             # 録音バッファをリセット
             with self.ai_audio_recording_lock:
                 self.ai_audio_recording_buffer.clear()
+                self.ai_audio_total_samples = 0
             with self.student_audio_recording_lock:
                 self.student_audio_recording_buffer.clear()
+                self.student_audio_total_samples = 0
             # 評価フィードバックテキストをリセット
             self.evaluation_feedback_text.value = ""
             self.evaluation_feedback_text.visible = False
@@ -2279,8 +2487,10 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
             # 録音バッファに追加（保存用、会話セッション中のみ）
             if self.conversation_running:
+                # 受信したPCM16をそのまま保持（bytesは不変のためコピー不要）
                 with self.ai_audio_recording_lock:
-                    self.ai_audio_recording_buffer.append(audio_array.copy())
+                    self.ai_audio_recording_buffer.append(int16_array)
+                    self.ai_audio_total_samples += int16_array.size
 
             # ストリーミング再生を開始（まだ開始していない、または停止している場合）
             # 再生スレッドが死んでいる場合も再起動する
@@ -2300,22 +2510,8 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
     def _start_ai_audio_stream(self) -> None:
         """AI音声のストリーミング再生を開始"""
-        # 試行するデバイスのリストを作成
-        candidate_devices = []
-        try:
-            if sd.default.device[1] >= 0:  # Output default
-                candidate_devices.append(sd.default.device[1])
-        except Exception:
-            pass
-        try:
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
-                if dev["max_output_channels"] > 0 and i not in candidate_devices:
-                    candidate_devices.append(i)
-        except Exception:
-            pass
-        if None not in candidate_devices:
-            candidate_devices.append(None)
+        # 試行するデバイス（AudioServiceのキャッシュ済みデバイス一覧を使用）
+        candidate_devices = self.audio_service.iter_output_devices()
 
         stream_opened = False
         for device_index in candidate_devices:
@@ -2350,6 +2546,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
             
             def playback_thread():
                 """バッファから音声を連続再生"""
+                _enable_ftz_daz()
                 is_playing_audio = False  # 音声再生中フラグ
                 
                 try:
@@ -2428,7 +2625,9 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
                                         # 再初期化も同様に候補デバイスを試す
                                         reinit_success = False
-                                        for dev_idx in candidate_devices:
+                                        for (
+                                            dev_idx
+                                        ) in self.audio_service.iter_output_devices():
                                             try:
                                                 self.ai_audio_stream = sd.OutputStream(
                                                     samplerate=24000,
@@ -2524,12 +2723,15 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
         self.silence_chunk_count = 0
 
         def audio_callback_24khz(
-            indata: NDArray[np.floating],
+            indata: NDArray[np.integer],
             frames: int,
             time_info: dict,
             status: sd.CallbackFlags,
         ) -> None:
-            """24kHzでの音声コールバック"""
+            """24kHzでの音声コールバック（int16で受信）"""
+            # PortAudioのコールバックスレッドで初回のみFTZ/DAZを有効化
+            _enable_ftz_daz()
+
             if (
                 not self.conversation_running
                 or not self.realtime_service
@@ -2543,50 +2745,53 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                 return
 
             try:
-                # 音声データを取得
-                audio_data = indata[:, 0] if indata.shape[1] > 0 else indata.flatten()
-                audio_list = audio_data.tolist()
-
-                # 音声データをnumpy配列に変換
-                np_data: NDArray[np.floating] = np.array(audio_list, dtype=np.float32)
-
-                # 音声を増幅して、より大きな音声を送信（2.0倍に増幅）
-                amplification_factor: float = 2.0
-                multiplied_data: NDArray[np.floating] = np.multiply(
-                    np_data, amplification_factor
-                )
-                amplified_data: NDArray[np.floating] = np.clip(
-                    multiplied_data, -1.0, 1.0
+                # 音声データを取得（int16のまま扱う）
+                audio_data: NDArray[np.integer] = (
+                    indata[:, 0] if indata.shape[1] > 0 else indata.flatten()
                 )
 
-                # RMS値を計算して音声レベルを判定（増幅後のデータで判定）
-                rms: float = float(np.sqrt(np.mean(amplified_data**2)))
+                # 音声を増幅して、より大きな音声を送信（2倍に増幅）
+                # スクラッチバッファにコピーしてインプレースでゲイン・クリップを適用
+                amplification_factor: int = 2
+                sample_count = audio_data.size
+                if self.student_pcm_scratch.size < sample_count:
+                    self.student_pcm_scratch = np.zeros(sample_count, dtype=np.int16)
+                amplified_data: NDArray[np.integer] = self.student_pcm_scratch[
+                    :sample_count
+                ]
+                np.copyto(amplified_data, audio_data)
+                _gain_clip_i16(amplified_data, amplification_factor)
+
+                # RMS値を計算して音声レベルを判定（増幅後のデータで判定、0.0〜1.0に正規化）
+                rms: float = 0.0
+                if sample_count > 0:
+                    amplified_i64 = amplified_data.astype(np.int64)
+                    sum_squares = int(np.dot(amplified_i64, amplified_i64))
+                    rms = float(np.sqrt(sum_squares / sample_count)) / 32768.0
 
                 # 学生用の波形を更新（常に更新）
-                if len(audio_list) > 0:
-                    peak = np.max(np.abs(amplified_data))
+                if sample_count > 0:
+                    peak = (
+                        float(np.max(np.abs(amplified_data.astype(np.int32))))
+                        / 32768.0
+                    )
                     value = (rms + peak) / 2.0
 
                     # バッファに追加
                     self.student_waveform_buffer.append(value)
-                    if len(self.student_waveform_buffer) > self.max_buffer_size:
-                        self.student_waveform_buffer.pop(0)
 
                     # 波形を更新
                     self._update_student_waveform()
 
-                # 録音バッファに追加（保存用、増幅前の元データを使用、会話セッション中のみ）
+                # 録音バッファに追加（保存用、増幅前の元データをint16のまま保持、会話セッション中のみ）
+                # indataはコールバック終了後に再利用されるためコピーする
                 if self.conversation_running:
                     with self.student_audio_recording_lock:
-                        self.student_audio_recording_buffer.append(np_data.copy())
+                        self.student_audio_recording_buffer.append(audio_data.copy())
+                        self.student_audio_total_samples += sample_count
 
-                # 16bit PCM形式に変換（増幅後のデータを使用）
-                pcm_scale_factor: float = 32767.0
-                scaled_data: NDArray[np.floating] = np.multiply(
-                    amplified_data, pcm_scale_factor
-                )
-                pcm_data: NDArray[np.integer] = scaled_data.astype(np.int16)
-                audio_bytes = pcm_data.tobytes()
+                # 16bit PCM形式（増幅後のデータをそのまま送信）
+                audio_bytes = amplified_data.tobytes()
 
                 # プレロールバッファに追加（常に最新の音声を保持）
                 self.audio_pre_buffer.append(audio_bytes)
@@ -2633,26 +2838,12 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                         self.speech_active_state = False
 
             except Exception as e:
-                print(f"学生音声処理エラー: {str(e)}")
+                _audio_log.error("学生音声処理エラー: %s", e)
 
         # 24kHzで録音を開始
         def start_recording():
-            # 試行するデバイスのリストを作成
-            candidate_devices = []
-            try:
-                if sd.default.device[0] >= 0:
-                    candidate_devices.append(sd.default.device[0])
-            except Exception:
-                pass
-            try:
-                devices = sd.query_devices()
-                for i, dev in enumerate(devices):
-                    if dev["max_input_channels"] > 0 and i not in candidate_devices:
-                        candidate_devices.append(i)
-            except Exception:
-                pass
-            if None not in candidate_devices:
-                candidate_devices.append(None)
+            # 試行するデバイス（AudioServiceのキャッシュ済みデバイス一覧を使用）
+            candidate_devices = self.audio_service.iter_input_devices()
 
             stream_opened = False
             last_error = None
@@ -2665,7 +2856,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                     self.student_recording_stream = sd.InputStream(
                         samplerate=24000,  # Realtime APIは24kHzを想定
                         channels=1,
-                        dtype=np.float32,
+                        dtype=np.int16,
                         blocksize=1024,
                         callback=audio_callback_24khz,
                         device=device_index,
@@ -2769,9 +2960,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
             buffer_size = len(self.student_waveform_buffer)
 
             if buffer_size > 0:
-                for i, value in enumerate(self.student_waveform_buffer):
-                    normalized_value = max(0.0, min(1.0, value * 10.0))
-                    data_points.append(ft.LineChartDataPoint(i, normalized_value))
+                data_points = level_buffer_to_points(self.student_waveform_buffer)
             else:
                 data_points = [
                     ft.LineChartDataPoint(i, 0.0) for i in range(self.max_buffer_size)
@@ -2786,7 +2975,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                 self.student_waveform_chart.data_series[0].data_points = data_points
                 self.page.update()
         except Exception as e:
-            print(f"学生波形更新エラー: {str(e)}")
+            _audio_log.error("学生波形更新エラー: %s", e)
 
     def _disable_other_tabs(self, active_test_id: str) -> None:
         """他のタブを無効化（グレー表示）"""
@@ -3067,6 +3256,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
     def _update_overall_timer(self) -> None:
         """全体の実行時間タイマーを更新"""
+        last_time_str: str | None = None  # 前回表示した文字列
         while self.overall_timer_running:
             if (
                 self.overall_start_time
@@ -3077,8 +3267,11 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                 hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
                 minutes, seconds = divmod(remainder, 60)
                 time_str = f"実行時間: {hours:02d}:{minutes:02d}:{seconds:02d}"
-                self.overall_timer_text.value = time_str
-                self.page.update()
+                # 表示が変わった場合のみ再描画する
+                if time_str != last_time_str:
+                    self.overall_timer_text.value = time_str
+                    self.page.update()
+                    last_time_str = time_str
             time.sleep(1)
 
     def _update_tab_timer(self, test_id: str) -> None:
@@ -3088,6 +3281,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
         timer_info = self.tab_timers[test_id]
         paused_start_time: datetime | None = None  # 一時停止開始時刻
+        last_time_str: str | None = None  # 前回表示した文字列
 
         while timer_info["running"]:
             if timer_info["start_time"] and timer_info["text"]:
@@ -3110,8 +3304,11 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                     hours, remainder = divmod(int(elapsed.total_seconds()), 3600)
                     minutes, seconds = divmod(remainder, 60)
                     time_str = f"テスト時間: {hours:02d}:{minutes:02d}:{seconds:02d}"
-                    timer_info["text"].value = time_str
-                    self.page.update()
+                    # 表示が変わった場合のみ再描画する
+                    if time_str != last_time_str:
+                        timer_info["text"].value = time_str
+                        self.page.update()
+                        last_time_str = time_str
 
                     # 会話テストの場合、指定時間が経過したら自動的に終了
                     if test_id == "conversation":
@@ -3227,8 +3424,8 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                 new_window = ConversationWindow(
                     self.page, session_dir=current_dir, save_dir=self.save_directory
                 )
+                # build()内のpage.add()で画面が反映されるため追加のupdate()は不要
                 new_window.build()
-                self.page.update()
             except Exception as e:
                 print(f"画面復帰エラー: {e}")
                 self.page.add(
@@ -3236,11 +3433,10 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                         f"画面の復帰中にエラーが発生しました: {e}", color=ft.colors.RED
                     )
                 )
-                self.page.update()
 
-        # 結果画面を表示
+        # 結果画面を表示（読み込み中表示を先に出し、構築はバックグラウンドで行う）
         result_window = ResultWindow(self.page, result_data, on_back)
-        result_window.build()
+        self.page.run_task(result_window.build_async)
 
     def _evaluate_conversation_async(self, is_final: bool = False) -> None:
         """会話を非同期で評価（バックグラウンドで実行、音声処理をブロックしない）
@@ -3256,6 +3452,7 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
 
         async def evaluate_async():
             """評価を非同期で実行"""
+            prediction_task: asyncio.Task | None = None
             try:
                 # 画面がアクティブでない場合は中断
                 if not self.is_active:
@@ -3290,6 +3487,17 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                         self._transition_to_result_screen(result_data)
                     return
 
+                # 総合スコア予測は会話評価の結果に依存しないため、
+                # 結果画面へ進める場合は会話評価と並行して開始しておく
+                if is_final and self._check_all_tests_completed():
+                    prediction_task = asyncio.create_task(
+                        self.evaluation_service.predict_total_score(
+                            conversation_text,
+                            self.listening_results,
+                            self.grammar_results,
+                        )
+                    )
+
                 # 評価サービスを呼び出し（完全に非同期で実行、音声処理をブロックしない）
                 # print("OpenAI APIで評価を実行中...")
                 evaluation_result = (
@@ -3347,7 +3555,8 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                                 # print("総合スコアを実行中...")
                                 # タイムアウト設定を追加（60秒）
                                 predicted_result = await asyncio.wait_for(
-                                    self.evaluation_service.predict_total_score(
+                                    prediction_task
+                                    or self.evaluation_service.predict_total_score(
                                         conversation_text,
                                         self.listening_results,
                                         self.grammar_results,
@@ -3447,32 +3656,16 @@ The conversation lasts about {self.conversation_session_duration_minutes} minute
                     status_text.color = ft.colors.RED
                     self.page.update()
             finally:
+                # 使われなかった総合スコア予測は取り消す
+                if prediction_task is not None and not prediction_task.done():
+                    prediction_task.cancel()
                 # 念のためオーバーレイを消す（もし残っていたら）
                 self._hide_evaluating_overlay()
                 self._is_evaluating = False
 
-        # 評価を非同期で実行（音声処理をブロックしない）
-        # 既存のイベントループがある場合はタスクとしてスケジュール、ない場合は別スレッドで新しいループを実行
-        try:
-            # 実行中のイベントループを取得（存在する場合）
-            # ループが存在することを確認するためだけに呼び出す
-            _ = asyncio.get_running_loop()
-            # 既存のループでタスクをスケジュール（既存のイベントループと統合）
-            asyncio.create_task(evaluate_async())
-        except RuntimeError:
-            # 実行中のループがない場合は、別スレッドで新しいループを作成して実行
-            # これにより、メインスレッドや音声処理スレッドをブロックしない
-            def evaluate_thread():
-                """評価を実行するスレッド（新しいイベントループで実行）"""
-                try:
-                    asyncio.run(evaluate_async())
-                except Exception as e:
-                    print(f"評価スレッドエラー: {str(e)}")
-
-            evaluation_thread_obj = threading.Thread(
-                target=evaluate_thread, daemon=True
-            )
-            evaluation_thread_obj.start()
+        # 評価を共有のバックグラウンドループで実行（音声処理をブロックしない）
+        # ループとHTTP接続を評価ごとに作り直さずに済む
+        self._run_in_background(evaluate_async())
 
     def _request_evaluation_from_realtime(self) -> None:
         """Realtime APIのセッション内で評価を依頼"""
@@ -3561,14 +3754,32 @@ Please respond in JSON format:
             print(f"Realtime API評価結果の解析エラー: {str(e)}")
 
     def _update_score_chart(self) -> None:
-        """評価スコアの折れ線グラフを更新"""
+        """評価スコアの折れ線グラフを更新
+
+        会話テストタブが表示されていない間は更新を保留し、
+        タブが選択されたときにまとめて反映する。
+        """
         if not self.score_chart:
             return
 
+        # 会話テストタブ以外が表示中の場合はグラフを再構築しない
+        selected_index = self.tabs.selected_index if self.tabs else None
+        if (
+            selected_index is None
+            or not 0 <= selected_index < len(self.test_items)
+            or self.test_items[selected_index]["id"] != "conversation"
+        ):
+            self.score_chart_dirty = True
+            return
+        self.score_chart_dirty = False
+
         try:
             history_size = len(self.evaluation_scores_history)
             # 空のデータでもグラフを表示（初期状態でも表示されるように）
             if history_size == 0:
+                # 描画済みのデータポイントも破棄
+                for points in self.score_series_points:
+                    points.clear()
                 # 空のデータポイントを設定（グラフが表示されるように）
                 empty_points: list[ft.LineChartDataPoint] = []
                 if (
@@ -3580,46 +3791,36 @@ Please respond in JSON format:
                     self.score_chart.data_series[2].data_points = empty_points
                     self.score_chart.data_series[3].data_points = empty_points
                     self.score_chart.data_series[4].data_points = empty_points
-                    self.page.update()
+                    self._request_update()
                 return
 
-            # 各スコアのデータポイントを生成
-            # 0: grammar, 1: vocabulary, 2: naturalness, 3: fluency, 4: overall
-            grammar_points: list[ft.LineChartDataPoint] = []
-            vocabulary_points: list[ft.LineChartDataPoint] = []
-            naturalness_points: list[ft.LineChartDataPoint] = []
-            fluency_points: list[ft.LineChartDataPoint] = []
-            overall_points: list[ft.LineChartDataPoint] = []
-
-            for i, score_data in enumerate(self.evaluation_scores_history):
-                grammar_points.append(
-                    ft.LineChartDataPoint(i, score_data.get("grammar", 0))
-                )
-                vocabulary_points.append(
-                    ft.LineChartDataPoint(i, score_data.get("vocabulary", 0))
-                )
-                naturalness_points.append(
-                    ft.LineChartDataPoint(i, score_data.get("naturalness", 0))
-                )
-                fluency_points.append(
-                    ft.LineChartDataPoint(i, score_data.get("fluency", 0))
-                )
-                overall_points.append(
-                    ft.LineChartDataPoint(i, score_data.get("overall", 0))
-                )
-
-            # グラフのX軸範囲を調整
-            max_x = max(history_size, 10)
-            self.score_chart.max_x = max_x
-
-            # データポイントを更新
+            # 各スコアのデータポイントを差分で追加（新しい評価分のみ）
+            series_points = self.score_series_points
+            plotted_size = len(series_points[0])
+            if plotted_size > history_size:
+                # 履歴がリセットされた場合は作り直す
+                for points in series_points:
+                    points.clear()
+                plotted_size = 0
+
+            data_point = ft.LineChartDataPoint
+            for i in range(plotted_size, history_size):
+                get_score = self.evaluation_scores_history[i].get
+                for points, key in zip(series_points, _SCORE_SERIES_KEYS):
+                    points.append(data_point(i, get_score(key, 0)))
+
+            # グラフのX軸範囲を調整（直近の評価のみを表示範囲とする）
+            window_start = max(0, history_size - _SCORE_CHART_VISIBLE_WINDOW)
+            self.score_chart.min_x = window_start
+            self.score_chart.max_x = max(history_size, window_start + 10)
+
+            # データポイントを更新（表示範囲外の古いポイントはクライアントに送らない）
             if self.score_chart.data_series and len(self.score_chart.data_series) >= 5:
-                self.score_chart.data_series[0].data_points = grammar_points
-                self.score_chart.data_series[1].data_points = vocabulary_points
-                self.score_chart.data_series[2].data_points = naturalness_points
-                self.score_chart.data_series[3].data_points = fluency_points
-                self.score_chart.data_series[4].data_points = overall_points
-                self.page.update()
+                for series, points in zip(self.score_chart.data_series, series_points):
+                    series.data_points = (
+                        points[window_start:] if window_start > 0 else points
+                    )
+                self._request_update()
         except Exception as e:
             print(f"スコアグラフ更新エラー: {str(e)}")
 
@@ -3655,7 +3856,7 @@ Please respond in JSON format:
 
         self.evaluation_feedback_text.value = feedback_text
         self.evaluation_feedback_text.visible = True
-        self.page.update()
+        self._request_update()
 
     def _get_or_create_session_dir(self) -> Path:
         """現在のセッション用の保存ディレクトリを取得または作成"""
@@ -3667,9 +3868,22 @@ Please respond in JSON format:
         base_save_dir.mkdir(parents=True, exist_ok=True)
 
         # フォルダ名を生成 TestRecord_YYYYMMDD_NNN
+        # 既存フォルダの走査は保存先・日付ごとに初回のみ行い、以降はカウンタを進める
         date_str = datetime.now().strftime("%Y%m%d")
-        existing_folders = list(base_save_dir.glob(f"TestRecord_{date_str}_*"))
-        folder_number = len(existing_folders) + 1
+        counter_key = (base_save_dir, date_str)
+        counters = ConversationWindow.record_folder_counters
+        if counter_key not in counters:
+            # os.scandirはディレクトリエントリの種別情報を使うため、要素ごとのstat()が不要
+            prefix = f"TestRecord_{date_str}_"
+            with os.scandir(base_save_dir) as entries:
+                counters[counter_key] = sum(
+                    1
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.is_dir(follow_symlinks=False)
+                )
+        folder_number = counters[counter_key] + 1
+        counters[counter_key] = folder_number
         record_folder_name = f"TestRecord_{date_str}_{folder_number:03d}"
 
         # レコードフォルダを作成
@@ -3679,6 +3893,21 @@ Please respond in JSON format:
         self.current_session_dir = save_dir
         return save_dir
 
+    def _write_wav_file(
+        self,
+        path: Path,
+        chunks: list[NDArray[np.int16]],
+        total_samples: int,
+    ) -> None:
+        """16bit PCM音声チャンク列を24kHzの16bit WAVファイルとして書き込む（別スレッド実行用）"""
+        pcm = _concat_pcm_chunks(chunks, total_samples)
+
+        # scipyは保存時に初めて読み込む（画面表示時のインポートコストを避ける）
+        import scipy.io.wavfile as wavfile
+
+        # scipyはint16配列をそのままPCM_16として書き出すため追加のコピーは発生しない
+        wavfile.write(str(path), 24000, pcm)
+
     async def _save_conversation_data_async(
         self,
         grammar_score: float,
@@ -3727,48 +3956,70 @@ Please respond in JSON format:
                 "timestamp": datetime.now().isoformat(),
             }
 
-            # JSONファイルを保存
+            # JSONファイルのパスとデータ
             json_path = save_dir / f"{base_filename}.json"
-            json_str = json.dumps(json_data, ensure_ascii=False, indent=2)
-            async with aiofiles.open(json_path, "w", encoding="utf-8") as f:
-                await f.write(json_str)
+            json_payload = _dumps_json_bytes(json_data)
 
-            # 音声ファイルの保存
-            try:
-                # AI音声の保存
-                with self.ai_audio_recording_lock:
-                    if self.ai_audio_recording_buffer:
-                        ai_audio = np.concatenate(self.ai_audio_recording_buffer)
-                        ai_wav_path = save_dir / f"{base_filename}_ai.wav"
-                        # float32 -> int16変換
-                        ai_audio_int16 = (ai_audio * 32767).astype(np.int16)
-                        wavfile.write(str(ai_wav_path), 24000, ai_audio_int16)
-                        # print(f"AI音声を保存しました: {ai_wav_path}")
-
-                # 学生音声の保存
-                with self.student_audio_recording_lock:
-                    if self.student_audio_recording_buffer:
-                        student_audio = np.concatenate(
-                            self.student_audio_recording_buffer
-                        )
-                        student_wav_path = save_dir / f"{base_filename}_student.wav"
-                        # float32 -> int16変換
-                        student_audio_int16 = (student_audio * 32767).astype(np.int16)
-                        wavfile.write(str(student_wav_path), 24000, student_audio_int16)
-                        # print(f"学生音声を保存しました: {student_wav_path}")
-            except Exception as e:
-                print(f"音声ファイルの保存エラー: {str(e)}")
+            # 録音バッファのスナップショットを取得（ロックは短時間だけ保持）
+            with self.ai_audio_recording_lock:
+                ai_chunks = list(self.ai_audio_recording_buffer)
+                ai_total_samples = self.ai_audio_total_samples
+            with self.student_audio_recording_lock:
+                student_chunks = list(self.student_audio_recording_buffer)
+                student_total_samples = self.student_audio_total_samples
+
+            # JSON・AI音声・学生音声の書き込みを並列に実行（UIをブロックしない）
+            audio_jobs: list[tuple[Path, list[NDArray[np.int16]], int]] = []
+            if ai_chunks:
+                audio_jobs.append(
+                    (save_dir / f"{base_filename}_ai.wav", ai_chunks, ai_total_samples)
+                )
+            if student_chunks:
+                audio_jobs.append(
+                    (
+                        save_dir / f"{base_filename}_student.wav",
+                        student_chunks,
+                        student_total_samples,
+                    )
+                )
+
+            # 講師メモもJSON・音声と同じバッチで書き込む
+            memo_jobs = []
             if self.student_memos:
                 memo_path = save_dir / f"{base_filename}_memos.txt"
-                memo_content = "=== Teacher's Notes ===\n\n"
+                # 文字列の連結を繰り返さず、行リストを最後に1回だけ結合する
+                memo_lines: list[str] = ["=== Teacher's Notes ===", ""]
                 for memo in self.student_memos:
                     category = memo.get("category", "general")
                     note = memo.get("note", "")
                     timestamp = memo.get("timestamp", "")
-                    memo_content += f"[{timestamp}] [{category}] {note}\n"
+                    memo_lines.append(f"[{timestamp}] [{category}] {note}")
+                memo_content = "\n".join(memo_lines) + "\n"
+                memo_jobs.append(
+                    asyncio.to_thread(
+                        memo_path.write_text, memo_content, encoding="utf-8"
+                    )
+                )
 
-                async with aiofiles.open(memo_path, "w", encoding="utf-8") as f:
-                    await f.write(memo_content)
+            json_result, *other_results = await asyncio.gather(
+                asyncio.to_thread(json_path.write_bytes, json_payload),
+                *(
+                    asyncio.to_thread(self._write_wav_file, path, chunks, total)
+                    for path, chunks, total in audio_jobs
+                ),
+                *memo_jobs,
+                return_exceptions=True,
+            )
+
+            # 音声ファイル・メモの保存エラーはログのみ（JSONの保存は継続扱い）
+            for result in other_results[: len(audio_jobs)]:
+                if isinstance(result, BaseException):
+                    print(f"音声ファイルの保存エラー: {str(result)}")
+            for result in other_results[len(audio_jobs) :]:
+                if isinstance(result, BaseException):
+                    print(f"メモファイルの保存エラー: {str(result)}")
+            if isinstance(json_result, BaseException):
+                raise json_result
 
             # リスニング音声（もし一時ファイルがあれば）を移動
             # Realtime APIの音声ログ保存は別途検討
@@ -3787,7 +4038,7 @@ Please respond in JSON format:
                         status_text.value = f"{status_text.value}\n{save_message}"
                     status_text.color = ft.colors.GREY_700
                     # UIを更新
-                    self.page.update()
+                    self._request_update()
             except RuntimeError as e:
                 # イベントループが閉じている場合は無視する（アプリ終了時など）
                 if "Event loop is closed" in str(e):
@@ -3814,41 +4065,17 @@ Please respond in JSON format:
 
         このメソッドは非推奨です。代わりに`_save_conversation_data_async`を使用してください。
         """
-        # 非同期メソッドを呼び出す（既存のイベントループを使用）
-        try:
-            # 実行中のイベントループを取得（存在する場合）
-            # 既存のループでタスクをスケジュール（既存のイベントループと統合）
-            asyncio.create_task(
-                self._save_conversation_data_async(
-                    grammar_score,
-                    vocabulary_score,
-                    naturalness_score,
-                    fluency_score,
-                    overall_score,
-                    feedback,
-                )
+        # 共有のバックグラウンドループで保存を実行（保存ごとにループを作らない）
+        self._run_in_background(
+            self._save_conversation_data_async(
+                grammar_score,
+                vocabulary_score,
+                naturalness_score,
+                fluency_score,
+                overall_score,
+                feedback,
             )
-        except RuntimeError:
-            # 実行中のループがない場合は、別スレッドで新しいループを作成して実行
-            # これにより、メインスレッドや音声処理スレッドをブロックしない
-            def save_thread():
-                """保存を実行するスレッド（新しいイベントループで実行）"""
-                try:
-                    asyncio.run(
-                        self._save_conversation_data_async(
-                            grammar_score,
-                            vocabulary_score,
-                            naturalness_score,
-                            fluency_score,
-                            overall_score,
-                            feedback,
-                        )
-                    )
-                except Exception as e:
-                    print(f"保存スレッドエラー: {str(e)}")
-
-            save_thread_obj = threading.Thread(target=save_thread, daemon=True)
-            save_thread_obj.start()
+        )
 
     def _create_listening_test_content(self) -> ft.Container:
         """リスニングテストタブのコンテンツを作成"""
@@ -3974,13 +4201,12 @@ Please respond in JSON format:
         """リスニング問題を生成して表示・再生する処理（別スレッド実行）"""
         try:
             # 1. 問題文生成
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            self.current_listening_text = loop.run_until_complete(
-                self.evaluation_service.openai_service.create_listening_question()
-            )
+            # OpenAIの非同期クライアントは評価と同じバックグラウンドループで使う
+            self.current_listening_text = asyncio.run_coroutine_threadsafe(
+                self.evaluation_service.openai_service.create_listening_question(),
+                self._get_background_loop(),
+            ).result()
             print(self.current_listening_text)
-            loop.close()
 
             if not self.current_listening_text:
                 self.listening_status_text.value = "問題生成に失敗しました。"
@@ -4049,10 +4275,6 @@ Please respond in JSON format:
                 self.page.update()
                 return
 
-            # 新しいイベントループを作成（スレッド内で実行されるため）
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
             if getattr(sys, "frozen", False):
                 # PyInstaller環境では_internalフォルダを使用（ユーザーの指示に従う）
                 # EXEと同じ階層にある_internalフォルダを探す
@@ -4066,12 +4288,13 @@ Please respond in JSON format:
 
             print(f"Creating speech file at: {speech_file}")
 
-            success = loop.run_until_complete(
+            # OpenAIの非同期クライアントは評価と同じバックグラウンドループで使う
+            success = asyncio.run_coroutine_threadsafe(
                 self.evaluation_service.openai_service.generate_speech(
                     passage_text, str(speech_file)
-                )
-            )
-            loop.close()
+                ),
+                self._get_background_loop(),
+            ).result()
 
             if not success:
                 self.listening_status_text.value = "音声生成に失敗しました。"
@@ -4088,7 +4311,9 @@ Please respond in JSON format:
             self.listening_status_text.value = f"音声再生中... ({self.current_listening_index + 1}/{len(self.listening_problems)})"
             self.page.update()
 
-            # pydubで再生
+            # pydubで再生（リスニングテスト時に初めて読み込む）
+            from pydub import AudioSegment
+
             sound = AudioSegment.from_mp3(str(speech_file))
 
             # 一時ファイルを削除
@@ -4505,13 +4730,12 @@ Please respond in JSON format:
         """文法問題を生成して表示する処理（別スレッド実行）"""
         try:
             # 問題文生成
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            grammar_json = loop.run_until_complete(
-                self.evaluation_service.openai_service.create_grammar_question()
-            )
+            # OpenAIの非同期クライアントは評価と同じバックグラウンドループで使う
+            grammar_json = asyncio.run_coroutine_threadsafe(
+                self.evaluation_service.openai_service.create_grammar_question(),
+                self._get_background_loop(),
+            ).result()
             print(grammar_json)
-            loop.close()
 
             if not grammar_json:
                 self.grammar_status_text.value = "問題生成に失敗しました。"
@@ -4721,8 +4945,8 @@ Please respond in JSON format:
                 )
             )
 
-            # 結果を非同期で保存
-            asyncio.create_task(self._save_grammar_data_async())
+            # 結果を共有のバックグラウンドループで非同期に保存
+            self._run_in_background(self._save_grammar_data_async())
 
             self.page.update()
 
@@ -4,10 +4,13 @@
 import flet as ft
 import threading
 import time
+import asyncio
+from collections import deque
 from typing import Callable
 import numpy as np
 from app.services.audio_service import AudioService
 from app.services.api_check_service import APICheckService
+from app.utils.waveform import levels_unchanged, normalize_levels, values_to_points
 
 
 class HomeWindow:
@@ -31,9 +34,11 @@ class HomeWindow:
         self.recorded_audio: list[float] | None = None
         
         # リアルタイム波形表示用
-        self.mic_waveform_buffer: list[float] = []
-        self.speaker_waveform_buffer: list[float] = []
+        # 上限を超えた古い値はdequeが自動的に破棄する
         self.max_buffer_size: int = 200  # 表示するデータポイント数
+        self.mic_waveform_buffer: deque[float] = deque(maxlen=self.max_buffer_size)
+        self.speaker_waveform_buffer: deque[float] = deque(maxlen=self.max_buffer_size)
+        self.last_pushed_mic_levels: np.ndarray | None = None  # 最後にマイク波形チャートへ送信した値（変化がない場合の再送防止用）
         self.last_update_time: float = 0.0
         self.update_interval: float = 0.05  # 50ms間隔で更新（20fps）
         
@@ -237,17 +242,15 @@ class HomeWindow:
     
     def _create_api_section(self) -> ft.Container:
         """APIチェックセクションの作成"""
-        # API状態表示用のテキストを初期化
-        api_results = self.api_check_service.check_all_apis()
-        
+        # API状態表示用のテキストを初期化（チェック結果が届くまでは確認中と表示）
         api_status_widgets = []
-        for api_result in api_results:
+        for api_name in APICheckService.API_NAMES:
             status_text = ft.Text(
-                f"{api_result['name']}の状態：{api_result['status']}",
+                f"{api_name}の状態：確認中...",
                 size=14,
                 color=ft.colors.BLACK
             )
-            self.api_status_texts[api_result['name']] = status_text
+            self.api_status_texts[api_name] = status_text
             api_status_widgets.append(status_text)
         
         return ft.Container(
@@ -293,9 +296,8 @@ class HomeWindow:
                 audio_data = self.audio_service.record_audio(duration=3.0)
                 
                 if len(audio_data) > 0:
-                    # 録音波形を表示（numpy配列をリストに変換）
-                    audio_list = audio_data.tolist() if isinstance(audio_data, np.ndarray) else audio_data
-                    self._update_mic_waveform(audio_list)
+                    # 録音波形を表示（numpy配列のまま渡す）
+                    self._update_mic_waveform(audio_data)
                     
                     if self.status_text:
                         self.status_text.value = "再生中..."
@@ -307,10 +309,11 @@ class HomeWindow:
                     self.audio_service.play_audio(audio_data, volume_gain=volume_gain)
                     
                     # 再生波形を表示（増幅後のデータを表示）
-                    amplified_audio_list = (np.array(audio_list) * volume_gain).tolist()
-                    # クリッピングを防ぐため-1.0～1.0の範囲に制限
-                    amplified_audio_list = [max(-1.0, min(1.0, x)) for x in amplified_audio_list]
-                    self._update_speaker_waveform(amplified_audio_list)
+                    # クリッピングを防ぐため-1.0～1.0の範囲に制限（一時配列を作らずに計算）
+                    amplified_audio = np.array(audio_data, dtype=np.float32)
+                    np.multiply(amplified_audio, volume_gain, out=amplified_audio)
+                    np.clip(amplified_audio, -1.0, 1.0, out=amplified_audio)
+                    self._update_speaker_waveform(amplified_audio)
                     
                     if self.status_text:
                         self.status_text.value = "テスト完了！マイクとスピーカーが正常に動作しています。"
@@ -339,23 +342,23 @@ class HomeWindow:
         test_thread = threading.Thread(target=test_audio, daemon=True)
         test_thread.start()
     
-    def _update_mic_waveform(self, audio_data: list[float] | None) -> None:
+    def _update_mic_waveform(self, audio_data: np.ndarray | list[float] | None) -> None:
         """マイク波形の更新（録音後）"""
-        if not self.mic_chart or not audio_data:
+        if not self.mic_chart or audio_data is None or len(audio_data) == 0:
             return
+        # 録音波形で上書きするため、次回のリアルタイム更新は必ず送信させる
+        self.last_pushed_mic_levels = None
         
         try:
             # データをサンプリングして表示
             data_length = len(audio_data)
             if data_length > 0:
                 # より多くのポイントを表示（200ポイント）
+                # NumPyで間引き・絶対値計算をまとめて行う（0から1の範囲）
+                samples = np.asarray(audio_data, dtype=np.float32)
                 step = max(1, data_length // self.max_buffer_size)
-                mic_points = []
-                for i in range(0, min(data_length, self.max_buffer_size * step), step):
-                    x = i // step
-                    # 振幅の絶対値を使用（0から1の範囲）
-                    y = abs(float(audio_data[i])) if i < data_length else 0.0
-                    mic_points.append(ft.LineChartDataPoint(x, y))
+                sampled = np.abs(samples[::step][:self.max_buffer_size])
+                mic_points = [ft.LineChartDataPoint(x, y) for x, y in enumerate(sampled.tolist())]
                 
                 if not mic_points:
                     mic_points = [ft.LineChartDataPoint(i, 0.0) for i in range(self.max_buffer_size)]
@@ -369,22 +372,20 @@ class HomeWindow:
         except Exception as e:
             print(f"マイク波形更新エラー: {str(e)}")
     
-    def _update_speaker_waveform(self, audio_data: list[float] | None) -> None:
+    def _update_speaker_waveform(self, audio_data: np.ndarray | list[float] | None) -> None:
         """スピーカー波形の更新"""
-        if not self.speaker_chart or not audio_data:
+        if not self.speaker_chart or audio_data is None or len(audio_data) == 0:
             return
         
         try:
             # データをサンプリングして表示
             data_length = len(audio_data)
             if data_length > 0:
+                # NumPyで間引き・絶対値計算をまとめて行う（0から1の範囲）
+                samples = np.asarray(audio_data, dtype=np.float32)
                 step = max(1, data_length // self.max_buffer_size)
-                speaker_points = []
-                for i in range(0, min(data_length, self.max_buffer_size * step), step):
-                    x = i // step
-                    # 振幅の絶対値を使用（0から1の範囲）
-                    y = abs(float(audio_data[i])) if i < data_length else 0.0
-                    speaker_points.append(ft.LineChartDataPoint(x, y))
+                sampled = np.abs(samples[::step][:self.max_buffer_size])
+                speaker_points = [ft.LineChartDataPoint(x, y) for x, y in enumerate(sampled.tolist())]
                 
                 if not speaker_points:
                     speaker_points = [ft.LineChartDataPoint(i, 0.0) for i in range(self.max_buffer_size)]
@@ -403,15 +404,17 @@ class HomeWindow:
         # マイクの監視を開始
         self.audio_service.start_mic_monitoring(self._on_mic_data_received)
     
-    def _on_mic_data_received(self, audio_data: list[float]) -> None:
+    def _on_mic_data_received(self, audio_data: np.ndarray) -> None:
         """マイクデータ受信時のコールバック"""
         try:
             # RMS値（実効値）を計算して波形の強度を取得
             if len(audio_data) > 0:
-                np_data = np.array(audio_data)
-                rms = np.sqrt(np.mean(np_data ** 2))
+                # float32配列ならコピーしない
+                np_data = np.asarray(audio_data, dtype=np.float32)
+                # np.dotで二乗和を計算（二乗の一時配列を作らない）
+                rms = float(np.sqrt(np.dot(np_data, np_data) / np_data.size))
                 # ピーク値も取得
-                peak = np.max(np.abs(np_data))
+                peak = float(np.abs(np_data).max())
                 # より視覚的に分かりやすくするため、RMSとピークの平均を使用
                 value = (rms + peak) / 2.0
             else:
@@ -419,8 +422,6 @@ class HomeWindow:
             
             # バッファに追加
             self.mic_waveform_buffer.append(value)
-            if len(self.mic_waveform_buffer) > self.max_buffer_size:
-                self.mic_waveform_buffer.pop(0)
             
             # 更新頻度を制限（一定間隔でのみ更新）
             current_time = time.time()
@@ -437,35 +438,39 @@ class HomeWindow:
             return
         
         try:
-            # バッファからデータポイントを生成
-            data_points: list[ft.LineChartDataPoint] = []
             buffer_size = len(self.mic_waveform_buffer)
             
             if buffer_size > 0:
                 # バッファのデータをそのまま使用（時系列データとして表示）
-                for i, value in enumerate(self.mic_waveform_buffer):
-                    # 値の範囲を0.0～1.0に正規化（実際のRMS値は小さいので拡大）
-                    normalized_value = max(0.0, min(1.0, value * 10.0))  # 10倍に拡大して視認性を向上
-                    data_points.append(ft.LineChartDataPoint(i, normalized_value))
+                # 値の範囲を0.0～1.0に正規化（10倍に拡大して視認性を向上）し、表示精度に丸める
+                normalized = normalize_levels(self.mic_waveform_buffer)
             else:
                 # データがない場合はゼロで埋める
-                data_points = [ft.LineChartDataPoint(i, 0.0) for i in range(self.max_buffer_size)]
+                normalized = np.zeros(self.max_buffer_size, dtype=np.float64)
+            
+            # 前回送信した波形からほとんど変化していない場合（無音時など）は送らない
+            if levels_unchanged(self.last_pushed_mic_levels, normalized):
+                return
+            self.last_pushed_mic_levels = normalized
             
             # チャートのX軸範囲を調整
             self.mic_chart.max_x = max(self.max_buffer_size, buffer_size)
             
             # データポイントを更新
             if self.mic_chart.data_series and len(self.mic_chart.data_series) > 0:
-                self.mic_chart.data_series[0].data_points = data_points
+                self.mic_chart.data_series[0].data_points = values_to_points(normalized)
                 self.page.update()
         except Exception as e:
             print(f"リアルタイム波形更新エラー: {str(e)}")
     
     def _check_apis(self) -> None:
-        """APIの状態をチェック"""
-        api_results = self.api_check_service.check_all_apis()
-        
-        for api_result in api_results:
+        """APIの状態をチェック（バックグラウンドで実行し、UIをブロックしない）"""
+        self.page.run_task(self._check_apis_async)
+    
+    async def _check_apis_async(self) -> None:
+        """各APIを並列にチェックし、応答があったものから表示を更新"""
+        async def check_one(name: str) -> None:
+            api_result = await asyncio.to_thread(self.api_check_service.check_api, name)
             if api_result['name'] in self.api_status_texts:
                 status_text = self.api_status_texts[api_result['name']]
                 status_text.value = f"{api_result['name']}の状態：{api_result['status']}"
@@ -477,8 +482,9 @@ class HomeWindow:
                     status_text.color = ft.colors.RED
                 else:
                     status_text.color = ft.colors.ORANGE
+            self.page.update()
         
-        self.page.update()
+        await asyncio.gather(*(check_one(name) for name in list(self.api_status_texts)))
     
     def _on_start_clicked(self, e: ft.ControlEvent) -> None:
         """開始ボタンがクリックされたときの処理"""
@@ -4,17 +4,160 @@
 
 import flet as ft
 from typing import Callable, Any
+import asyncio
 import json
+import re
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from itertools import groupby
+
+try:
+    import orjson
+except ImportError:  # orjsonは任意依存（未インストール時は標準のjsonを使用）
+    orjson = None
+
+# よく使うFlet定数（ビルダー内で毎回属性をたどらないようにまとめておく）
+_BOLD = ft.FontWeight.BOLD
+_WHITE = ft.colors.WHITE
+_GREY_700 = ft.colors.GREY_700
+_CROSS_CENTER = ft.CrossAxisAlignment.CENTER
+
+# フィードバック中の推定会話レベル（"**推定会話レベル: X/10**" の形式）
+_LEVEL_RE = re.compile(r"推定会話レベル:\s*(\d+)/10")
+
+# 研究用データの出力キーと結果データのキーの対応
+# （conversation_levelはフィードバックから抽出するため入力キーなし）
+_RESEARCH_FIELDS: tuple[tuple[str, str | None], ...] = (
+    ("predicted_total", "predicted_total_score"),
+    ("listening_score", "listening_score"),
+    ("reading_score", "reading_score"),  # 総合スコアから
+    ("conversation_level", None),
+    ("grammar", "grammar_score"),
+    ("vocabulary", "vocabulary_score"),
+    ("naturalness", "naturalness_score"),
+    ("fluency", "fluency_score"),
+    ("overall", "overall_score"),
+)
+
+# 会話評価スコアの表示定義（キー・ラベル・色を同じ順序で並べる）
+_SCORE_KEYS: tuple[str, ...] = (
+    "grammar_score",
+    "vocabulary_score",
+    "naturalness_score",
+    "fluency_score",
+    "overall_score",
+)
+_SCORE_LABELS: tuple[str, ...] = ("文法", "語彙", "自然さ", "流暢さ", "会話総合")
+_SCORE_COLORS: tuple[str, ...] = (
+    ft.colors.BLUE,
+    ft.colors.GREEN,
+    ft.colors.PURPLE,
+    ft.colors.ORANGE,
+    ft.colors.RED,
+)
+
+# プログレスバーの値を求めるための逆数（総合スコアは1000点満点、各スコアは100点満点）
+_INV_1000: float = 1.0 / 1000.0
+_INV_100: float = 0.01
+
+# 共通の枠線・角丸（コントロールではない設定値なので使い回せる）
+_BORDER_GREY_200 = ft.border.all(1, ft.colors.GREY_200)
+_BORDER_GREY_300 = ft.border.all(1, ft.colors.GREY_300)
+_BORDER_RED_100 = ft.border.all(1, ft.colors.RED_100)
+_BAR_BORDER_RADIUS = ft.border_radius.all(5)
+
+# 共通の文字スタイル（コントロールではない設定値なので使い回せる）
+_TITLE_STYLE = ft.TextStyle(size=32, weight=_BOLD)
+_SECTION_TITLE_STYLE = ft.TextStyle(size=24, weight=_BOLD)
+_SCORE_ROW_STYLE = ft.TextStyle(size=18, weight=_BOLD)
+
+# スコア棒グラフの横グリッド線（コントロールではない設定値なので使い回せる）
+_HORIZONTAL_GRID_LINES = ft.ChartGridLines(
+    color=ft.colors.GREY_300, width=1, dash_pattern=[3, 3]
+)
+# スコア棒グラフのツールチップ背景色
+_TOOLTIP_BGCOLOR: str = ft.colors.with_opacity(0.8, ft.colors.BLUE_GREY)
+
+# フィードバックの段落数がこれ以上の場合は段落ごとに分割して仮想化スクロールで表示する
+_FEEDBACK_LISTVIEW_MIN_BLOCKS: int = 12
+# 仮想化スクロール時のフィードバック表示領域の高さ（外側のスクロール内に置くため固定）
+_FEEDBACK_LISTVIEW_HEIGHT: int = 600
+# 段落に分割できないフィードバックでも、この文字数を超える場合はスクロール領域に収める
+_FEEDBACK_SCROLL_MIN_CHARS: int = 5000
+# Markdown記法で使われる文字（いずれも含まないフィードバックはプレーンテキストで表示）
+_MARKDOWN_CHARS: frozenset[str] = frozenset("#*`_[>|~")
+
+# 戻るボタンとコピーボタンの間隔（従来の既定間隔10 + 余白Container20 + 間隔10と同じ）
+_BUTTON_ROW_SPACING: int = 40
+
+# リスニング問題の選択肢ラベル
+_OPTION_LABELS: tuple[str, ...] = ("A", "B", "C", "D")
+# 選択肢の表示スタイル（(正解の選択肢か, 誤って選んだ選択肢か) → (色, 太さ, 付記)）
+_OPTION_STYLES: dict[tuple[bool, bool], tuple[str, ft.FontWeight, str]] = {
+    (True, False): (ft.colors.GREEN_700, _BOLD, " (Correct)"),
+    (True, True): (ft.colors.GREEN_700, _BOLD, " (Correct)"),
+    (False, True): (ft.colors.RED_700, ft.FontWeight.NORMAL, " (Your Answer)"),
+    (False, False): (ft.colors.BLACK, ft.FontWeight.NORMAL, ""),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ResultData:
+    """結果画面に表示する会話評価データ（構築後は変更しない）"""
+
+    grammar_score: float = 0
+    vocabulary_score: float = 0
+    naturalness_score: float = 0
+    fluency_score: float = 0
+    overall_score: float = 0
+    predicted_total_score: int | None = None
+    feedback: str = "フィードバックがありません。"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ResultData":
+        """結果データの辞書から作成（未設定・Noneの項目は既定値を使う）"""
+        return cls(
+            **{
+                field.name: data[field.name]
+                for field in fields(cls)
+                if data.get(field.name) is not None
+            }
+        )
+
+    @property
+    def score_values(self) -> tuple[float, ...]:
+        """各スコアを_SCORE_KEYSの順に返す"""
+        return (
+            self.grammar_score,
+            self.vocabulary_score,
+            self.naturalness_score,
+            self.fluency_score,
+            self.overall_score,
+        )
 
 
 class ResultWindow:
     """結果画面のウィンドウクラス"""
 
+    # インスタンス属性を固定してインスタンス辞書を持たせない
+    __slots__ = (
+        "page",
+        "result_data",
+        "scores",
+        "on_back_callback",
+        "interactive",
+        "_back_handler",
+        "_results_by_passage",
+        "_listening_tab_container",
+        "_snack_bar",
+        "_scores_cache",
+        "_score_ratios",
+    )
+
     def __init__(
         self,
         page: ft.Page,
-        result_data: dict[str, Any],
+        result_data: dict[str, Any] | ResultData,
         on_back_callback: Callable[[], None] | None = None,
     ) -> None:
         """
@@ -31,82 +174,149 @@ class ResultWindow:
                     "overall_score": int,
                     "feedback": str
                 }
+                またはResultData
             on_back_callback: 戻るボタンが押されたときのコールバック
         """
         self.page = page
-        self.result_data = result_data
+        if isinstance(result_data, ResultData):
+            self.result_data: dict[str, Any] = asdict(result_data)
+            self._set_scores(result_data)
+        else:
+            self.result_data = result_data
+            self._set_scores(ResultData.from_dict(result_data))
         self.on_back_callback = on_back_callback
+        # スコア棒グラフのツールチップ・ホバー操作を有効にするか
+        # （値は詳細表示にあるため既定では無効にして当たり判定を省く）
+        self.interactive: bool = False
+        # 戻るボタンのハンドラ（バインド済みメソッドを1回だけ生成して使い回す）
+        self._back_handler: Callable[[ft.ControlEvent], None] = self._on_back_clicked
+
+        # パッセージごとにまとめたリスニング結果（初回使用時に作成）
+        self._results_by_passage: dict[int, list[dict[str, Any]]] | None = None
+        # 総合結果のリスニングタブの入れ物（内容は初回選択時に構築）
+        self._listening_tab_container: ft.Container | None = None
+        # 通知用のスナックバー（初回表示時に作成し、以降は使い回す）
+        self._snack_bar: ft.SnackBar | None = None
+
+    def _set_scores(self, scores: ResultData) -> None:
+        """表示するスコアを設定し、プログレスバー用の値（0.0〜1.0に制限）を求めておく"""
+        self.scores = scores
+        # (ラベル, スコア, 色)の組（_scoresで初回使用時に作成）
+        self._scores_cache: tuple[tuple[str, float, str], ...] | None = None
+        inv100 = _INV_100
+        self._score_ratios: tuple[float, ...] = tuple(
+            max(0.0, min(1.0, value * inv100)) for value in scores.score_values
+        )
+
+    def _scores(self) -> tuple[tuple[str, float, str], ...]:
+        """(ラベル, スコア, 色)の組を_SCORE_KEYSの順に返す（グラフと詳細表示で共用）"""
+        if self._scores_cache is None:
+            self._scores_cache = tuple(
+                zip(_SCORE_LABELS, self.scores.score_values, _SCORE_COLORS)
+            )
+        return self._scores_cache
 
     def _extract_level(self, feedback: str) -> int | None:
         """フィードバックテキストから会話レベルを抽出"""
-        try:
-            # "**推定会話レベル: X/10**" の形式を探す
-            import re
-
-            match = re.search(r"推定会話レベル:\s*(\d+)/10", feedback)
-            if match:
-                return int(match.group(1))
-            return None
-        except Exception:
+        if not feedback:
             return None
 
+        match = _LEVEL_RE.search(feedback)
+        return int(match.group(1)) if match else None
+
     def _on_copy_research_data_clicked(self, e: ft.ControlEvent) -> None:
         """研究用データをクリップボードにコピー"""
         try:
-            # データの抽出と整形
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "predicted_total": self.result_data.get("predicted_total_score"),
-                "listening_score": self.result_data.get("listening_score"),
-                "reading_score": self.result_data.get("reading_score"),  # 総合スコアから
-                "conversation_level": self._extract_level(
-                    self.result_data.get("feedback", "")
-                ),
-                "grammar": self.result_data.get("grammar_score"),
-                "vocabulary": self.result_data.get("vocabulary_score"),
-                "naturalness": self.result_data.get("naturalness_score"),
-                "fluency": self.result_data.get("fluency_score"),
-                "overall": self.result_data.get("overall_score"),
-            }
+            # データの抽出と整形（出力キーの順序は従来どおり）
+            rd = self.result_data
+            data: dict[str, Any] = {"timestamp": datetime.now().isoformat()}
+            for output_key, input_key in _RESEARCH_FIELDS:
+                if input_key is None:
+                    data[output_key] = self._extract_level(rd.get("feedback") or "")
+                else:
+                    data[output_key] = rd.get(input_key)
 
             # JSON文字列に変換
-            json_str = json.dumps(data, ensure_ascii=False)
+            if orjson is not None:
+                json_str = orjson.dumps(data).decode("utf-8")
+            else:
+                json_str = json.dumps(data, ensure_ascii=False)
 
             # クリップボードにコピー
             self.page.set_clipboard(json_str)
 
             # 通知を表示
-            self.page.snack_bar = ft.SnackBar(
-                content=ft.Text("研究用データをクリップボードにコピーしました"),
-                bgcolor=ft.colors.GREEN_700,
+            self._show_snack_bar(
+                "研究用データをクリップボードにコピーしました", ft.colors.GREEN_700
             )
-            self.page.snack_bar.open = True
-            self.page.update()
 
         except Exception as ex:
             print(f"データコピーエラー: {ex}")
-            self.page.snack_bar = ft.SnackBar(
-                content=ft.Text("データのコピーに失敗しました"),
-                bgcolor=ft.colors.RED_700,
+            self._show_snack_bar("データのコピーに失敗しました", ft.colors.RED_700)
+
+    def _show_snack_bar(self, message: str, bgcolor: str) -> None:
+        """スナックバーで通知を表示
+
+        表示済みのスナックバーがある場合は内容を差し替えて、そのコントロールだけを更新する。
+        """
+        snack_bar = self._snack_bar
+        if snack_bar is None or self.page.snack_bar is not snack_bar:
+            # 初回はページに追加する必要があるためページ全体を更新
+            self._snack_bar = ft.SnackBar(
+                content=ft.Text(message), bgcolor=bgcolor, open=True
             )
-            self.page.snack_bar.open = True
+            self.page.snack_bar = self._snack_bar
             self.page.update()
+            return
+
+        snack_bar.content.value = message
+        snack_bar.bgcolor = bgcolor
+        snack_bar.open = True
+        snack_bar.update()
 
     def build(self) -> None:
         """ウィジェットの構築"""
-        self.page.clean()
+        self._show_content(self._build_content())
+
+    async def build_async(self) -> None:
+        """ウィジェットの構築（非同期版）
+
+        先に読み込み中の表示を出し、ウィジェットの構築を
+        別スレッドで行ってから結果画面に差し替える。
+        """
+        self.page.controls.clear()
+        self.page.controls.append(
+            ft.Container(
+                content=ft.ProgressRing(),
+                alignment=ft.alignment.center,
+                expand=True,
+                bgcolor=_WHITE,
+            )
+        )
+        self.page.update()
+        content = await asyncio.to_thread(self._build_content)
+        self._show_content(content)
+
+    def _show_content(self, content: ft.Container) -> None:
+        """画面コンテンツをページに表示する"""
+        # clean()・add()はそれぞれ単独でクライアントへ送信されるため、
+        # コントロールの入れ替えをまとめてからupdate()で1回だけ反映する
+        self.page.controls.clear()
+        self.page.controls.append(content)
+        self.page.update()
 
+    def _build_content(self) -> ft.Container:
+        """結果データの種類に応じた画面コンテンツを構築"""
         # 結果データの種類をチェック
         has_conversation = "overall_score" in self.result_data
         has_listening = "listening_results" in self.result_data
 
         # 両方のデータがある場合はタブで表示（総合結果として）
         if has_conversation and has_listening:
-            self._build_combined_result()
-        elif has_listening:
-            self._build_listening_result()
-        else:
-            self._build_conversation_result()
+            return self._build_combined_result()
+        if has_listening:
+            return self._build_listening_result()
+        return self._build_conversation_result()
 
     def _create_copy_data_button(self) -> ft.ElevatedButton:
         """研究用データコピーボタンを作成"""
@@ -116,16 +326,26 @@ class ResultWindow:
             on_click=self._on_copy_research_data_clicked,
             width=200,
             height=50,
-            bgcolor=ft.colors.GREY_700,
-            color=ft.colors.WHITE,
+            bgcolor=_GREY_700,
+            color=_WHITE,
+        )
+
+    def _create_back_button(self) -> ft.ElevatedButton:
+        """メイン画面に戻るボタンを作成"""
+        return ft.ElevatedButton(
+            "メイン画面に戻る",
+            on_click=self._back_handler,
+            width=200,
+            height=50,
+            bgcolor=ft.colors.BLUE_400,
+            color=_WHITE,
         )
 
-    def _build_combined_result(self) -> None:
+    def _build_combined_result(self) -> ft.Container:
         """総合結果画面（タブ表示）の構築"""
         title = ft.Text(
             "総合テスト結果",
-            size=32,
-            weight=ft.FontWeight.BOLD,
+            style=_TITLE_STYLE,
             text_align=ft.TextAlign.CENTER,
             color=ft.colors.BLACK,
         )
@@ -133,13 +353,15 @@ class ResultWindow:
         # 会話（総合）タブの内容
         conversation_content = self._create_conversation_content_container()
 
-        # リスニングタブの内容
-        listening_content = self._create_listening_content_container()
+        # リスニングタブの内容（タブが選択されたときに構築する）
+        listening_content = ft.Container(expand=True)
+        self._listening_tab_container = listening_content
 
         # タブの作成
         tabs = ft.Tabs(
             selected_index=0,
             animation_duration=300,
+            on_change=self._on_tab_changed,
             tabs=[
                 ft.Tab(
                     text="総合スコア・会話評価",
@@ -154,43 +376,42 @@ class ResultWindow:
         )
 
         # 戻るボタン
-        back_button = ft.ElevatedButton(
-            "メイン画面に戻る",
-            on_click=self._on_back_clicked,
-            width=200,
-            height=50,
-            bgcolor=ft.colors.BLUE_400,
-            color=ft.colors.WHITE,
-        )
+        back_button = self._create_back_button()
 
+        # 余白用のContainerを置かず、Columnの間隔と外側の余白で同じレイアウトにする
+        # （従来: 既定の間隔10 + 余白Container20 + 間隔10 = 40）
         content = ft.Container(
             content=ft.Column(
                 [
-                    ft.Container(height=20),
                     title,
-                    ft.Container(height=20),
                     tabs,
-                    ft.Container(height=20),
                     ft.Row(
-                        [
-                            back_button,
-                            ft.Container(width=20),
-                            self._create_copy_data_button(),
-                        ],
+                        [back_button, self._create_copy_data_button()],
                         alignment=ft.MainAxisAlignment.CENTER,
+                        spacing=_BUTTON_ROW_SPACING,
                     ),
-                    ft.Container(height=20),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                horizontal_alignment=_CROSS_CENTER,
+                spacing=40,
                 expand=True,
             ),
-            padding=20,
+            padding=ft.padding.symmetric(horizontal=20, vertical=50),
             expand=True,
-            bgcolor=ft.colors.WHITE,
+            bgcolor=_WHITE,
         )
 
-        self.page.add(content)
-        self.page.update()
+        return content
+
+    def _on_tab_changed(self, e: ft.ControlEvent) -> None:
+        """総合結果のタブが切り替えられたときの処理（リスニングタブを初回のみ構築）"""
+        container = self._listening_tab_container
+        if (
+            e.control.selected_index == 1
+            and container is not None
+            and container.content is None
+        ):
+            container.content = self._create_listening_content_container()
+            container.update()
 
     def _create_conversation_content_container(self) -> ft.Container:
         """会話（総合）結果のコンテナを作成（スクロール可能）"""
@@ -215,7 +436,7 @@ class ResultWindow:
                     feedback_section,
                     ft.Container(height=30),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                horizontal_alignment=_CROSS_CENTER,
                 scroll=ft.ScrollMode.AUTO,
             ),
             padding=20,
@@ -224,32 +445,11 @@ class ResultWindow:
 
     def _create_listening_content_container(self) -> ft.Container:
         """リスニング結果のコンテナを作成（スクロール可能）"""
-        score = self.result_data.get("listening_score", 0)
-        total = self.result_data.get("listening_question_count", 0)
-        percentage = (score / total * 100) if total > 0 else 0
-
-        score_display = ft.Container(
-            content=ft.Column(
-                [
-                    ft.Text("リスニング正解率", size=18, color=ft.colors.GREY_700),
-                    ft.Text(
-                        f"{percentage:.1f}%",
-                        size=48,
-                        weight=ft.FontWeight.BOLD,
-                        color=ft.colors.BLUE_600
-                        if percentage >= 60
-                        else ft.colors.RED_400,
-                    ),
-                    ft.Text(
-                        f"{score} / {total} 問正解", size=20, weight=ft.FontWeight.BOLD
-                    ),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            ),
-            padding=20,
-            border=ft.border.all(1, ft.colors.GREY_300),
-            border_radius=10,
-            bgcolor=ft.colors.WHITE,
+        rd = self.result_data
+        score_display = self._build_score_display(
+            rd.get("listening_score", 0),
+            rd.get("listening_question_count", 0),
+            "リスニング正解率",
         )
 
         review_section = self._create_listening_review_section()
@@ -260,25 +460,58 @@ class ResultWindow:
                     ft.Container(height=20),
                     score_display,
                     ft.Container(height=30),
-                    ft.Text("復習・スクリプト確認", size=24, weight=ft.FontWeight.BOLD),
+                    ft.Text("復習・スクリプト確認", style=_SECTION_TITLE_STYLE),
                     ft.Container(height=10),
                     review_section,
                     ft.Container(height=30),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                horizontal_alignment=_CROSS_CENTER,
                 scroll=ft.ScrollMode.AUTO,
             ),
             padding=20,
             expand=True,
         )
 
-    def _build_conversation_result(self) -> None:
+    def _build_score_display(self, score: int, total: int, label: str) -> ft.Container:
+        """リスニングの正解率表示を作成
+
+        Args:
+            score: 正解数
+            total: 問題数
+            label: 正解率の見出し
+        """
+        percentage = (score / total * 100) if total > 0 else 0
+
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text(label, size=18, color=_GREY_700),
+                    ft.Text(
+                        f"{percentage:.1f}%",
+                        size=48,
+                        weight=_BOLD,
+                        color=ft.colors.BLUE_600
+                        if percentage >= 60
+                        else ft.colors.RED_400,
+                    ),
+                    ft.Text(
+                        f"{score} / {total} 問正解", size=20, weight=_BOLD
+                    ),
+                ],
+                horizontal_alignment=_CROSS_CENTER,
+            ),
+            padding=20,
+            border=_BORDER_GREY_300,
+            border_radius=10,
+            bgcolor=_WHITE,
+        )
+
+    def _build_conversation_result(self) -> ft.Container:
         """会話テスト結果画面の構築"""
         # タイトル
         title = ft.Text(
             "会話テスト結果",
-            size=32,
-            weight=ft.FontWeight.BOLD,
+            style=_TITLE_STYLE,
             text_align=ft.TextAlign.CENTER,
             color=ft.colors.BLACK,
         )
@@ -293,14 +526,7 @@ class ResultWindow:
         feedback_section = self._create_feedback_section()
 
         # 戻るボタン
-        back_button = ft.ElevatedButton(
-            "メイン画面に戻る",
-            on_click=self._on_back_clicked,
-            width=200,
-            height=50,
-            bgcolor=ft.colors.BLUE_400,
-            color=ft.colors.WHITE,
-        )
+        back_button = self._create_back_button()
 
         content = ft.Container(
             content=ft.Column(
@@ -321,78 +547,45 @@ class ResultWindow:
                     feedback_section,
                     ft.Container(height=30),
                     ft.Row(
-                        [
-                            back_button,
-                            ft.Container(width=20),
-                            self._create_copy_data_button(),
-                        ],
+                        [back_button, self._create_copy_data_button()],
                         alignment=ft.MainAxisAlignment.CENTER,
+                        spacing=_BUTTON_ROW_SPACING,
                     ),
                     ft.Container(height=20),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                horizontal_alignment=_CROSS_CENTER,
                 scroll=ft.ScrollMode.AUTO,
             ),
             padding=40,
             expand=True,
-            bgcolor=ft.colors.WHITE,
+            bgcolor=_WHITE,
         )
 
-        self.page.add(content)
-        self.page.update()
+        return content
 
-    def _build_listening_result(self) -> None:
+    def _build_listening_result(self) -> ft.Container:
         """リスニングテスト結果画面の構築"""
         # タイトル
         title = ft.Text(
             "リスニングテスト結果",
-            size=32,
-            weight=ft.FontWeight.BOLD,
+            style=_TITLE_STYLE,
             text_align=ft.TextAlign.CENTER,
             color=ft.colors.BLACK,
         )
 
-        score = self.result_data.get("listening_score", 0)
-        total = self.result_data.get("listening_question_count", 0)
-        percentage = (score / total * 100) if total > 0 else 0
-
         # スコア表示
-        score_display = ft.Container(
-            content=ft.Column(
-                [
-                    ft.Text("正解率", size=18, color=ft.colors.GREY_700),
-                    ft.Text(
-                        f"{percentage:.1f}%",
-                        size=48,
-                        weight=ft.FontWeight.BOLD,
-                        color=ft.colors.BLUE_600
-                        if percentage >= 60
-                        else ft.colors.RED_400,
-                    ),
-                    ft.Text(
-                        f"{score} / {total} 問正解", size=20, weight=ft.FontWeight.BOLD
-                    ),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-            ),
-            padding=20,
-            border=ft.border.all(1, ft.colors.GREY_300),
-            border_radius=10,
-            bgcolor=ft.colors.WHITE,
+        rd = self.result_data
+        score_display = self._build_score_display(
+            rd.get("listening_score", 0),
+            rd.get("listening_question_count", 0),
+            "正解率",
         )
 
         # パッセージと問題の表示エリア
         review_section = self._create_listening_review_section()
 
         # 戻るボタン
-        back_button = ft.ElevatedButton(
-            "メイン画面に戻る",
-            on_click=self._on_back_clicked,
-            width=200,
-            height=50,
-            bgcolor=ft.colors.BLUE_400,
-            color=ft.colors.WHITE,
-        )
+        back_button = self._create_back_button()
 
         content = ft.Container(
             content=ft.Column(
@@ -402,60 +595,49 @@ class ResultWindow:
                     ft.Container(height=20),
                     score_display,
                     ft.Container(height=30),
-                    ft.Text("復習・スクリプト確認", size=24, weight=ft.FontWeight.BOLD),
+                    ft.Text("復習・スクリプト確認", style=_SECTION_TITLE_STYLE),
                     ft.Container(height=10),
                     review_section,
                     ft.Container(height=30),
                     ft.Row(
-                        [
-                            back_button,
-                            ft.Container(width=20),
-                            self._create_copy_data_button(),
-                        ],
+                        [back_button, self._create_copy_data_button()],
                         alignment=ft.MainAxisAlignment.CENTER,
+                        spacing=_BUTTON_ROW_SPACING,
                     ),
                     ft.Container(height=20),
                 ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                horizontal_alignment=_CROSS_CENTER,
                 scroll=ft.ScrollMode.AUTO,
             ),
             padding=40,
             expand=True,
-            bgcolor=ft.colors.WHITE,
+            bgcolor=_WHITE,
         )
 
-        self.page.add(content)
-        self.page.update()
+        return content
 
     def _create_listening_review_section(self) -> ft.Container:
         """リスニングのスクリプトと問題ごとの詳細を作成"""
         passages = self.result_data.get("listening_passages", [])
-        results = self.result_data.get("listening_results", [])
+        results_by_passage = self._get_results_by_passage()
 
-        # 結果をパッセージごとにグループ化
-        # resultsの各アイテムには passage_index が含まれていると仮定
-        results_by_passage = {}
-        for res in results:
-            p_idx = res.get("passage_index", 0)
-            if p_idx not in results_by_passage:
-                results_by_passage[p_idx] = []
-            results_by_passage[p_idx].append(res)
-
-        content_controls = []
+        content_controls: list[ft.Control] = []
+        # ループ内で使うメソッドはローカル変数に束縛しておく
+        append = content_controls.append
 
         for i, passage_data in enumerate(passages):
             passage_text = passage_data.get("passage", "")
-            passage_questions = results_by_passage.get(i, [])
+            passage_questions = results_by_passage.get(i, ())
 
             # パッセージ表示
-            content_controls.append(
+            append(
                 ft.Container(
                     content=ft.Column(
                         [
                             ft.Text(
                                 f"Passage {i + 1}",
                                 size=18,
-                                weight=ft.FontWeight.BOLD,
+                                weight=_BOLD,
                                 color=ft.colors.BLUE_800,
                             ),
                             ft.Container(height=10),
@@ -468,10 +650,9 @@ class ResultWindow:
                     padding=20,
                     bgcolor=ft.colors.GREY_50,
                     border_radius=10,
-                    border=ft.border.all(1, ft.colors.GREY_200),
+                    border=_BORDER_GREY_200,
                 )
             )
-            content_controls.append(ft.Container(height=20))
 
             # このパッセージに関連する問題の表示
             for q_idx, res in enumerate(passage_questions):
@@ -486,28 +667,21 @@ class ResultWindow:
                 status_color = ft.colors.GREEN if is_correct else ft.colors.RED
 
                 # 選択肢の表示文字列作成
-                options_display = []
-                labels = ["A", "B", "C", "D"]
+                options_display: list[ft.Control] = []
+                append_option = options_display.append
+                # 不正解の場合のみユーザーの選択肢を強調する
+                wrong_ans = None if is_correct else user_ans
+                label_count = len(_OPTION_LABELS)
                 for j, opt in enumerate(options):
-                    label_char = labels[j] if j < len(labels) else "?"
-                    # 正解の選択肢を強調
-                    is_this_correct = label_char == correct_ans
-                    # ユーザーが間違えて選んだ選択肢を強調
-                    is_this_wrong_choice = label_char == user_ans and not is_correct
-
-                    opt_color = ft.colors.BLACK
-                    weight = ft.FontWeight.NORMAL
-
-                    if is_this_correct:
-                        opt_color = ft.colors.GREEN_700
-                        weight = ft.FontWeight.BOLD
-                        opt = f"{opt} (Correct)"
-                    elif is_this_wrong_choice:
-                        opt_color = ft.colors.RED_700
-                        opt = f"{opt} (Your Answer)"
-
-                    options_display.append(
-                        ft.Text(f"{label_char}. {opt}", color=opt_color, weight=weight)
+                    label_char = _OPTION_LABELS[j] if j < label_count else "?"
+                    # 正解の選択肢・ユーザーが間違えて選んだ選択肢を強調
+                    opt_color, weight, note = _OPTION_STYLES[
+                        (label_char == correct_ans, label_char == wrong_ans)
+                    ]
+                    append_option(
+                        ft.Text(
+                            f"{label_char}. {opt}{note}", color=opt_color, weight=weight
+                        )
                     )
 
                 # 問題カード
@@ -520,7 +694,7 @@ class ResultWindow:
                                 [
                                     ft.Text(
                                         f"Q{q_idx + 1}. {question_text}",
-                                        weight=ft.FontWeight.BOLD,
+                                        weight=_BOLD,
                                         size=16,
                                     ),
                                     ft.Container(height=5),
@@ -528,7 +702,7 @@ class ResultWindow:
                                     ft.Container(height=5),
                                     ft.Text(
                                         f"正解: {correct_ans} / あなたの回答: {user_ans}",
-                                        color=ft.colors.GREY_700,
+                                        color=_GREY_700,
                                     ),
                                 ],
                                 expand=True,
@@ -537,72 +711,80 @@ class ResultWindow:
                         vertical_alignment=ft.CrossAxisAlignment.START,
                     ),
                     padding=15,
-                    border=ft.border.all(
-                        1, ft.colors.GREY_200 if is_correct else ft.colors.RED_100
-                    ),
-                    bgcolor=ft.colors.WHITE if is_correct else ft.colors.RED_50,
+                    border=_BORDER_GREY_200 if is_correct else _BORDER_RED_100,
+                    bgcolor=_WHITE if is_correct else ft.colors.RED_50,
                     border_radius=8,
                 )
-                content_controls.append(question_card)
-                content_controls.append(ft.Container(height=10))
+                append(question_card)
 
-            content_controls.append(ft.Divider(height=40, color=ft.colors.GREY_400))
+            append(ft.Divider(height=40, color=ft.colors.GREY_400))
 
+        # 余白用のContainerは置かず、要素間の間隔はColumnのspacingで取る
         return ft.Container(
-            content=ft.Column(content_controls),
+            content=ft.Column(content_controls, spacing=20),
             width=800,
         )
 
+    def _get_results_by_passage(self) -> dict[int, list[dict[str, Any]]]:
+        """リスニング結果をパッセージごとにまとめて返す（作成は初回のみ）"""
+        if self._results_by_passage is None:
+            # resultsの各アイテムには passage_index が含まれていると仮定
+            def passage_index(res: dict[str, Any]) -> int:
+                return res.get("passage_index", 0)
+
+            # 通常は出題順（パッセージ順）に並んでいるためソートはほぼ線形時間で済む
+            # （安定ソートなのでパッセージ内の問題順は保たれる）
+            results = sorted(
+                self.result_data.get("listening_results", []), key=passage_index
+            )
+            self._results_by_passage = {
+                index: list(group) for index, group in groupby(results, key=passage_index)
+            }
+        return self._results_by_passage
+
     def _create_score_chart(self) -> ft.Container:
         """レーダーチャート風の表示（FletにRadarChartがないので棒グラフで代用）を作成"""
-        scores = [
-            ("文法", self.result_data.get("grammar_score", 0), ft.colors.BLUE),
-            ("語彙", self.result_data.get("vocabulary_score", 0), ft.colors.GREEN),
-            ("自然さ", self.result_data.get("naturalness_score", 0), ft.colors.PURPLE),
-            ("流暢さ", self.result_data.get("fluency_score", 0), ft.colors.ORANGE),
-            ("会話総合", self.result_data.get("overall_score", 0), ft.colors.RED),
-        ]
-
-        bar_groups = []
-        for i, (label, score, color) in enumerate(scores):
-            bar_groups.append(
-                ft.BarChartGroup(
-                    x=i,
-                    bar_rods=[
-                        ft.BarChartRod(
-                            from_y=0,
-                            to_y=score,
-                            width=40,
-                            color=color,
-                            tooltip=f"{label}: {score}",
-                            border_radius=ft.border_radius.all(5),
-                        )
-                    ],
-                )
+        scores = self._scores()
+        interactive = self.interactive
+
+        bar_groups = [
+            ft.BarChartGroup(
+                x=i,
+                bar_rods=[
+                    ft.BarChartRod(
+                        from_y=0,
+                        to_y=score,
+                        width=40,
+                        color=color,
+                        tooltip=f"{label}: {score}" if interactive else None,
+                        border_radius=_BAR_BORDER_RADIUS,
+                    )
+                ],
             )
+            for i, (label, score, color) in enumerate(scores)
+        ]
 
         chart = ft.BarChart(
             bar_groups=bar_groups,
-            border=ft.border.all(1, ft.colors.GREY_200),
+            border=_BORDER_GREY_200,
             bottom_axis=ft.ChartAxis(
                 labels=[
-                    ft.ChartAxisLabel(value=0, label=ft.Text("文法")),
-                    ft.ChartAxisLabel(value=1, label=ft.Text("語彙")),
-                    ft.ChartAxisLabel(value=2, label=ft.Text("自然さ")),
-                    ft.ChartAxisLabel(value=3, label=ft.Text("流暢さ")),
+                    ft.ChartAxisLabel(value=i, label=ft.Text(label))
+                    for i, label in enumerate(_SCORE_LABELS[:-1])
+                ]
+                + [
                     ft.ChartAxisLabel(
-                        value=4, label=ft.Text("会話総合", weight=ft.FontWeight.BOLD)
-                    ),
+                        value=len(_SCORE_LABELS) - 1,
+                        label=ft.Text(_SCORE_LABELS[-1], weight=_BOLD),
+                    )
                 ],
                 labels_size=40,
             ),
             left_axis=ft.ChartAxis(labels_size=40, title=ft.Text("スコア")),
-            horizontal_grid_lines=ft.ChartGridLines(
-                color=ft.colors.GREY_300, width=1, dash_pattern=[3, 3]
-            ),
-            tooltip_bgcolor=ft.colors.with_opacity(0.8, ft.colors.BLUE_GREY),
+            horizontal_grid_lines=_HORIZONTAL_GRID_LINES,
+            tooltip_bgcolor=_TOOLTIP_BGCOLOR if interactive else None,
             max_y=100,
-            interactive=True,
+            interactive=interactive,
             expand=True,
         )
 
@@ -611,117 +793,102 @@ class ResultWindow:
             width=500,
             height=300,
             padding=20,
-            border=ft.border.all(1, ft.colors.GREY_300),
+            border=_BORDER_GREY_300,
             border_radius=10,
-            bgcolor=ft.colors.WHITE,
+            bgcolor=_WHITE,
         )
 
     def _create_score_details(self) -> ft.Container:
         """スコア詳細表示を作成"""
+        entries = self._scores()
+        ratios = self._score_ratios
+        # 詳細表示では会話総合スコアを先頭に表示する
+        _, overall_score, overall_color = entries[-1]
         scores = [
-            ("会話総合スコア", self.result_data.get("overall_score", 0), ft.colors.RED),
-            ("文法", self.result_data.get("grammar_score", 0), ft.colors.BLUE),
-            ("語彙", self.result_data.get("vocabulary_score", 0), ft.colors.GREEN),
-            ("自然さ", self.result_data.get("naturalness_score", 0), ft.colors.PURPLE),
-            ("流暢さ", self.result_data.get("fluency_score", 0), ft.colors.ORANGE),
+            ("会話総合スコア", overall_score, ratios[-1], overall_color),
+            *(
+                (label, score, ratio, color)
+                for (label, score, color), ratio in zip(entries[:-1], ratios)
+            ),
         ]
 
-        rows = []
-
         # 総合スコア表示（存在する場合）
-        predicted_total_score = self.result_data.get("predicted_total_score")
+        total_rows: list[ft.Control] = []
+        predicted_total_score = self.scores.predicted_total_score
         if predicted_total_score is not None:
-            rows.append(
-                ft.Container(
-                    content=ft.Row(
-                        [
-                            ft.Text(
-                                "総合スコア",
-                                size=18,
-                                weight=ft.FontWeight.BOLD,
-                                width=100,
-                            ),
-                            ft.ProgressBar(
-                                value=predicted_total_score / 1000,
-                                color=ft.colors.INDIGO,
-                                bgcolor=ft.colors.GREY_100,
-                                expand=True,
-                                height=10,
-                            ),
-                            ft.Container(width=10),
-                            ft.Text(
-                                f"{predicted_total_score}",
-                                size=18,
-                                weight=ft.FontWeight.BOLD,
-                                width=60,
-                                text_align=ft.TextAlign.RIGHT,
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                    ),
-                    padding=ft.padding.only(bottom=15),
-                )
+            # 満点を超える値でもプログレスバーが1.0を超えないように制限する
+            value = predicted_total_score
+            ratio = value * _INV_1000 if value <= 1000 else 1.0
+            total_rows.append(
+                self._score_row("総合スコア", ratio, ft.colors.INDIGO, str(value))
             )
-            rows.append(ft.Divider(height=20, color=ft.colors.GREY_300))
+            # 行間（spacing）の分だけ区切り線の高さを詰めて従来と同じ間隔にする
+            total_rows.append(ft.Divider(height=5, color=ft.colors.GREY_300))
 
-        for label, score, color in scores:
-            rows.append(
-                ft.Container(
-                    content=ft.Row(
-                        [
-                            ft.Text(
-                                label, size=18, weight=ft.FontWeight.BOLD, width=100
-                            ),
-                            ft.ProgressBar(
-                                value=score / 100,
-                                color=color,
-                                bgcolor=ft.colors.GREY_100,
-                                expand=True,
-                                height=10,
-                            ),
-                            ft.Container(width=10),
-                            ft.Text(
-                                f"{score}/100",
-                                size=18,
-                                weight=ft.FontWeight.BOLD,
-                                width=60,
-                                text_align=ft.TextAlign.RIGHT,
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                    ),
-                    padding=ft.padding.only(bottom=15),
-                )
-            )
+        score_rows: list[ft.Control] = [
+            self._score_row(label, ratio, color, f"{score}/100")
+            for label, score, ratio, color in scores
+        ]
 
         return ft.Container(
-            content=ft.Column(rows),
+            # 行ごとの下余白（15）+ 既定の間隔（10）をColumnのspacingにまとめる
+            content=ft.Column(total_rows + score_rows, spacing=25),
             width=400,
-            padding=20,
-            border=ft.border.all(1, ft.colors.GREY_300),
+            padding=ft.padding.only(left=20, top=20, right=20, bottom=35),
+            border=_BORDER_GREY_300,
             border_radius=10,
-            bgcolor=ft.colors.WHITE,
+            bgcolor=_WHITE,
+        )
+
+    def _score_row(
+        self, label: str, progress_value: float, color: str, value_text: str
+    ) -> ft.Row:
+        """スコア詳細の1行（ラベル・プログレスバー・値）を作成
+
+        行間は親のColumnのspacingで取るため、余白用のContainerで包まない。
+
+        Args:
+            label: 行のラベル
+            progress_value: プログレスバーの値（0.0〜1.0）
+            color: プログレスバーの色
+            value_text: 右端に表示する値の文字列
+        """
+        return ft.Row(
+            [
+                ft.Text(label, style=_SCORE_ROW_STYLE, width=100),
+                ft.ProgressBar(
+                    value=progress_value,
+                    color=color,
+                    bgcolor=ft.colors.GREY_100,
+                    expand=True,
+                    height=10,
+                ),
+                ft.Container(width=10),
+                ft.Text(
+                    value_text,
+                    style=_SCORE_ROW_STYLE,
+                    width=60,
+                    text_align=ft.TextAlign.RIGHT,
+                ),
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
 
     def _create_feedback_section(self) -> ft.Container:
         """フィードバック表示セクションを作成"""
-        feedback_text = self.result_data.get("feedback", "フィードバックがありません。")
+        feedback_text = self.scores.feedback
 
         return ft.Container(
             content=ft.Column(
                 [
                     ft.Text(
-                        "AIからのフィードバック", size=20, weight=ft.FontWeight.BOLD
+                        "AIからのフィードバック", size=20, weight=_BOLD
                     ),
                     ft.Container(height=10),
                     ft.Container(
-                        content=ft.Markdown(
-                            feedback_text,
-                            selectable=True,
-                            extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
-                        ),
+                        content=self._create_feedback_body(feedback_text),
                         padding=20,
-                        border=ft.border.all(1, ft.colors.GREY_300),
+                        border=_BORDER_GREY_300,
                         border_radius=10,
                         bgcolor=ft.colors.GREY_50,
                         width=940,  # チャート(500) + スペース(40) + 詳細(400)
@@ -731,6 +898,45 @@ class ResultWindow:
             alignment=ft.alignment.center,
         )
 
+    def _create_feedback_body(self, feedback_text: str) -> ft.Control:
+        """フィードバック本文のウィジェットを作成
+
+        長いフィードバックは空行で段落に分割してListViewに並べ、
+        画面外の段落を描画しないようにする（コードブロックを含む場合は分割しない）。
+        Markdown記法を含まない場合はMarkdownの解析を行わずテキストとして表示する。
+        """
+        if _MARKDOWN_CHARS.isdisjoint(feedback_text):
+            return ft.Text(feedback_text, selectable=True)
+
+        blocks = [block for block in feedback_text.split("\n\n") if block.strip()]
+        if len(blocks) < _FEEDBACK_LISTVIEW_MIN_BLOCKS or "```" in feedback_text:
+            markdown = ft.Markdown(
+                feedback_text,
+                selectable=True,
+                extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
+            )
+            if len(feedback_text) <= _FEEDBACK_SCROLL_MIN_CHARS:
+                return markdown
+            # 分割できない長文は高さを固定したスクロール領域に収め、表示範囲外を描画しない
+            return ft.Column(
+                [markdown],
+                scroll=ft.ScrollMode.AUTO,
+                height=_FEEDBACK_LISTVIEW_HEIGHT,
+            )
+
+        return ft.ListView(
+            controls=[
+                ft.Markdown(
+                    block,
+                    selectable=True,
+                    extension_set=ft.MarkdownExtensionSet.GITHUB_WEB,
+                )
+                for block in blocks
+            ],
+            spacing=10,
+            height=_FEEDBACK_LISTVIEW_HEIGHT,
+        )
+
     def _on_back_clicked(self, e: ft.ControlEvent) -> None:
         """戻るボタンがクリックされたときの処理"""
         if self.on_back_callback:
@@ -2,7 +2,7 @@
 データモデル（スキーマ定義）
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List
 
@@ -18,6 +18,9 @@ class VocabularyItem(BaseModel):
 class EvaluationResult(BaseModel):
     """評価結果のデータモデル"""
 
+    # スキーマの構築はインポート時ではなく初回使用時に行う
+    model_config = ConfigDict(defer_build=True, extra="ignore", validate_assignment=False)
+
     pronunciation_score: float | None = None  # 発音スコア
     accuracy_score: float | None = None  # 正確性スコア
     fluency_score: float | None = None  # 流暢さスコア
@@ -31,6 +34,11 @@ class EvaluationResult(BaseModel):
 class ConversationData(BaseModel):
     """会話データのデータモデル"""
 
-    audio_data: bytes | None = None  # 音声データ（バイト列）
+    # スキーマの構築はインポート時ではなく初回使用時に行う
+    model_config = ConfigDict(defer_build=True, extra="ignore", validate_assignment=False)
+
+    audio_data: bytes | None = Field(
+        default=None, repr=False
+    )  # 音声データ（バイト列、reprには出力しない）
     text: str | None = None  # 会話テキスト
     reference_text: str | None = None  # 参照テキスト（発音評価用）
@@ -3,18 +3,100 @@ API接続チェックサービス
 各種LLM APIの接続状態をチェックする
 """
 
+import functools
 import os
-from typing import Dict, List
-from openai import OpenAI
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Callable, Dict, List
+import httpx
+from openai import AuthenticationError, OpenAI
+
+# 接続チェック用クライアントのタイムアウト（応答待ち5秒、接続2秒）
+_CLIENT_TIMEOUT: httpx.Timeout = httpx.Timeout(5.0, connect=2.0)
+# 429/5xx・タイムアウト・接続エラー時の再試行回数
+# （SDKがジッター付き指数バックオフで再試行する）
+_MAX_RETRIES: int = 2
+
+# チェック結果のキャッシュ（メソッド名 -> (取得時刻, 結果)）
+_CACHE: Dict[str, tuple[float, Dict[str, str]]] = {}
+# 「利用可能」の結果を保持する秒数
+_TTL: float = 30.0
+# エラー・不明の結果を保持する秒数（復旧をすぐ反映できるよう短くする）
+_ERROR_TTL: float = 5.0
+
+
+def _ttl_cache(
+    func: Callable[["APICheckService"], Dict[str, str]],
+) -> Callable[["APICheckService"], Dict[str, str]]:
+    """
+    APIチェック結果を一定時間キャッシュするデコレーター
+
+    画面から繰り返しチェックされてもHTTPリクエストはTTLごとに1回に抑える。
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: "APICheckService") -> Dict[str, str]:
+        now = time.monotonic()
+        cached = _CACHE.get(func.__name__)
+        if cached is not None:
+            timestamp, result = cached
+            ttl = _TTL if result.get("status") == "利用可能" else _ERROR_TTL
+            if now - timestamp < ttl:
+                return dict(result)
+
+        result = func(self)
+        _CACHE[func.__name__] = (now, result)
+        return dict(result)
+
+    return wrapper
 
 
 class APICheckService:
     """API接続状態をチェックするサービスクラス"""
 
+    # チェック対象のAPI名（画面側でプレースホルダー表示に使用）
+    API_NAMES: tuple[str, ...] = ("OpenAI API", "OpenRouter API")
+
+    # check_all_apis 全体の待ち時間の上限（秒）
+    CHECK_TIMEOUT: float = 10.0
+
     def __init__(self) -> None:
         """初期化処理"""
-        pass
+        # 接続先（base_url）ごとのクライアント（APIキー, クライアント）
+        # 2回目以降のチェックで接続プールを再利用しTLSハンドシェイクを省く
+        self._clients: Dict[str | None, tuple[str, OpenAI]] = {}
 
+    def _get_client(self, api_key: str, base_url: str | None = None) -> OpenAI:
+        """
+        接続チェック用のクライアントを取得（APIキーが変わった場合のみ再作成）
+
+        Args:
+            api_key: APIキー
+            base_url: 接続先URL（Noneの場合はOpenAI）
+
+        Returns:
+            OpenAIクライアント
+        """
+        cached = self._clients.get(base_url)
+        if cached is not None and cached[0] == api_key:
+            return cached[1]
+
+        client = OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=_CLIENT_TIMEOUT,
+            max_retries=_MAX_RETRIES,
+        )
+        self._clients[base_url] = (api_key, client)
+        return client
+
+    @staticmethod
+    def clear_cache() -> None:
+        """チェック結果のキャッシュを破棄する"""
+        _CACHE.clear()
+
+    @_ttl_cache
     def check_openai_api(self) -> Dict[str, str]:
         """
         OpenAI APIの接続状態をチェック
@@ -33,15 +115,22 @@ class APICheckService:
             }
 
         try:
-            client = OpenAI(api_key=api_key)
-            # 簡単なリクエストで接続確認（models.list()を呼び出して確認）
+            client = self._get_client(api_key)
+            # 使用モデル1件だけを取得して接続確認
+            # （models.list()は全モデルの一覧を返すため重い）
             try:
-                models = client.models.list()
+                client.models.retrieve(os.getenv("OPENAI_MODEL", "gpt-5-nano"))
                 return {
                     "name": "OpenAI API",
                     "status": "利用可能",
                     "message": "APIキーが有効です",
                 }
+            except AuthenticationError:
+                return {
+                    "name": "OpenAI API",
+                    "status": "エラー",
+                    "message": "無効なAPIキーです",
+                }
             except Exception as e:
                 return {
                     "name": "OpenAI API",
@@ -55,6 +144,7 @@ class APICheckService:
                 "message": f"初期化エラー: {str(e)}",
             }
 
+    @_ttl_cache
     def check_openrouter_api(self) -> Dict[str, str]:
         """
         OpenRouter APIの接続状態をチェック
@@ -74,15 +164,22 @@ class APICheckService:
         try:
             # OpenRouterはOpenAI互換APIとして利用可能
             # base_urlを指定して接続確認
-            client = OpenAI(api_key=api_key, base_url="https://openrouter.ai/api/v1")
-            # 簡単なリクエストで接続確認
+            client = self._get_client(api_key, "https://openrouter.ai/api/v1")
+            # キー情報のエンドポイントで接続確認
+            # （/modelsは認証不要かつ全モデルの一覧を返すため、キーの確認にならない）
             try:
-                models = client.models.list()
+                client.get("/key", cast_to=httpx.Response)
                 return {
                     "name": "OpenRouter API",
                     "status": "利用可能",
                     "message": "APIキーが有効です",
                 }
+            except AuthenticationError:
+                return {
+                    "name": "OpenRouter API",
+                    "status": "エラー",
+                    "message": "無効なAPIキーです",
+                }
             except Exception as e:
                 return {
                     "name": "OpenRouter API",
@@ -96,19 +193,65 @@ class APICheckService:
                 "message": f"初期化エラー: {str(e)}",
             }
 
+    def check_api(self, name: str) -> Dict[str, str]:
+        """
+        指定したAPIの接続状態をチェック
+
+        Args:
+            name: API名（API_NAMESのいずれか）
+
+        Returns:
+            API名と状態を含む辞書
+        """
+        if name == "OpenAI API":
+            return self.check_openai_api()
+        if name == "OpenRouter API":
+            return self.check_openrouter_api()
+        return {
+            "name": name,
+            "status": "不明",
+            "message": "未対応のAPIです",
+        }
+
     def check_all_apis(self) -> List[Dict[str, str]]:
         """
         全てのAPIの接続状態をチェック
 
+        各APIのチェックはスレッドで並行実行し、所要時間を最も遅いAPIの
+        応答時間に抑える。CHECK_TIMEOUT秒以内に終わらなかったAPIは
+        「不明」として扱う。
+
         Returns:
-            API状態のリスト
+            API状態のリスト（API_NAMESの順）
         """
-        results: List[Dict[str, str]] = []
+        results: Dict[str, Dict[str, str]] = {}
 
-        # OpenAI APIのチェック
-        results.append(self.check_openai_api())
-
-        # OpenRouter APIのチェック
-        results.append(self.check_openrouter_api())
+        # 呼び出しごとにエグゼキューターを作成し、タイムアウトしたチェックの
+        # 完了を待たずに戻れるよう shutdown(wait=False) で解放する
+        executor = ThreadPoolExecutor(max_workers=len(self.API_NAMES))
+        try:
+            futures: Dict[Future[Dict[str, str]], str] = {
+                executor.submit(self.check_api, name): name for name in self.API_NAMES
+            }
+            try:
+                for future in as_completed(futures, timeout=self.CHECK_TIMEOUT):
+                    name = futures[future]
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = {
+                            "name": name,
+                            "status": "エラー",
+                            "message": f"チェックエラー: {str(e)}",
+                        }
+            except FuturesTimeoutError:
+                print("API接続チェックがタイムアウトしました")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        return results
+        timeout_message = f"{self.CHECK_TIMEOUT:g}秒以内に応答がありませんでした"
+        return [
+            results.get(name)
+            or {"name": name, "status": "不明", "message": timeout_message}
+            for name in self.API_NAMES
+        ]
@@ -5,9 +5,21 @@
 
 import sounddevice as sd
 import numpy as np
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Iterator, List
+import asyncio
 import threading
 import time
+from app.utils.log_queue import get_queued_logger
+
+# 音声サービス用のロガー
+# コールバックスレッドではキューに積むだけにして、出力は別スレッドのリスナーで行う
+_log = get_queued_logger(__name__)
+
+# ストリームのステータス警告を出す最短間隔（秒）
+_STATUS_LOG_INTERVAL: float = 1.0
+
+# 録音・再生時間を過ぎてもストリームが終了しない場合に待つ猶予（秒）
+_CAPTURE_TIMEOUT_MARGIN: float = 2.0
 
 
 class AudioService:
@@ -19,14 +31,149 @@ class AudioService:
         self.is_playing: bool = False
         self.recording_thread: Optional[threading.Thread] = None
         self.playing_thread: Optional[threading.Thread] = None
-        self.mic_callback: Optional[Callable[[List[float]], None]] = None
-        self.speaker_callback: Optional[Callable[[List[float]], None]] = None
+        self.mic_callback: Optional[Callable[[np.ndarray], None]] = None
+        self.speaker_callback: Optional[Callable[[np.ndarray], None]] = None
 
         # 音声設定
         self.chunk_size: int = 1024
         self.sample_rate: int = 44100
         self.channels: int = 1
         self.dtype: np.dtype = np.float32
+        # スピーカー監視で渡す無音データ（マイクと同じくnumpy配列で渡し、使い回す）
+        # 共有バッファのため読み取り専用にしておく
+        self._silence: np.ndarray = np.zeros(self.chunk_size, dtype=self.dtype)
+        self._silence.setflags(write=False)
+        # スピーカー監視スレッドを起こすイベント（停止時・データ到着時にset）
+        self._speaker_wakeup: threading.Event = threading.Event()
+        # スピーカー監視のコールバック間隔（秒）。ダミーデータのため10Hzで十分
+        self._speaker_interval: float = 0.1
+        # 再生を途中で止めるためのイベント（stop_playbackでset）
+        self._playback_stop: threading.Event = threading.Event()
+        # 録音を途中で止めるためのイベント（stop_recordingでset）
+        self._recording_stop: threading.Event = threading.Event()
+        # 最後にストリームのステータス警告を出した時刻（time.monotonic）
+        self._last_status_log: float = 0.0
+
+        # デバイス一覧のキャッシュ（取得時刻, sd.query_devices()の結果）
+        # デバイス数が多い環境では列挙に時間がかかるため短時間再利用する
+        self._devices_cache: tuple[float, list] | None = None
+        self._devices_cache_ttl: float = 5.0
+        # デフォルトデバイス番号のキャッシュ（入力, 出力）
+        self._default_devices_cache: tuple[int, int] | None = None
+        # 最後に開けたデバイス番号（sd.default.deviceと同じく[入力, 出力]）
+        # 次回はこのデバイスから試し、候補の走査を省く
+        self._last_good_devices: list[int | None] = [None, None]
+
+    def _get_devices_cached(self) -> list:
+        """
+        デバイス一覧をキャッシュ付きで取得
+
+        Returns:
+            sd.query_devices()の結果
+        """
+        now = time.monotonic()
+        if self._devices_cache is not None:
+            timestamp, devices = self._devices_cache
+            if now - timestamp < self._devices_cache_ttl:
+                return devices
+
+        devices = sd.query_devices()
+        self._devices_cache = (now, devices)
+        return devices
+
+    def _get_default_devices(self) -> tuple[int, int]:
+        """
+        デフォルトの入力/出力デバイス番号をキャッシュ付きで取得
+
+        Returns:
+            (入力デバイス番号, 出力デバイス番号)
+        """
+        if self._default_devices_cache is None:
+            default_input, default_output = sd.default.device
+            self._default_devices_cache = (default_input, default_output)
+        return self._default_devices_cache
+
+    def _invalidate_device_cache(self) -> None:
+        """デバイス関連のキャッシュを破棄（デバイス構成の変化に追従するため）"""
+        self._devices_cache = None
+        self._default_devices_cache = None
+
+    def _iter_devices(self, role: int, channels_key: str) -> Iterator[Optional[int]]:
+        """
+        試行するデバイスを順に返す
+
+        デフォルトデバイスで成功すればデバイス一覧の取得（時間がかかる）は
+        行わない。2つ目以降が要求されたときに初めて一覧を取得する。
+
+        Args:
+            role: sd.default.deviceのインデックス（0: 入力, 1: 出力）
+            channels_key: 対応チャンネル数のキー（max_input_channels等）
+
+        Yields:
+            前回成功したデバイス、デフォルトデバイス、その他の対応デバイス、
+            Noneの順のデバイス番号
+        """
+        # 0. 前回成功したデバイス
+        last_good = self._last_good_devices[role]
+        if last_good is not None:
+            yield last_good
+
+        default_index: Optional[int] = None
+
+        # 1. デフォルトデバイス
+        try:
+            default_index = self._get_default_devices()[role]
+        except Exception:
+            self._default_devices_cache = None
+        if (
+            default_index is not None
+            and default_index >= 0
+            and default_index != last_good
+        ):
+            yield default_index
+
+        # 2. その他の対応デバイス
+        try:
+            devices = self._get_devices_cached()
+        except Exception:
+            self._devices_cache = None
+            devices = []
+        for i, dev in enumerate(devices):
+            if dev[channels_key] > 0 and i not in (default_index, last_good):
+                yield i
+
+        # 最後にNoneを返す（デフォルトの挙動を試す）
+        yield None
+
+    def _remember_device(self, role: int, device_index: Optional[int]) -> None:
+        """デバイスを開けた場合に次回の最初の候補として記憶"""
+        if device_index is not None:
+            self._last_good_devices[role] = device_index
+
+    def _forget_device(self, role: int, device_index: Optional[int]) -> None:
+        """記憶したデバイスで失敗した場合は次回から改めて候補を走査する"""
+        if self._last_good_devices[role] == device_index:
+            self._last_good_devices[role] = None
+
+    def _log_stream_status(self, label: str, status: sd.CallbackFlags) -> None:
+        """
+        ストリームのステータス（アンダーラン等）を間引いて記録
+
+        コールバックから毎回出力すると処理が遅れてさらに音切れを招くため、
+        _STATUS_LOG_INTERVAL秒に1回までに抑える。
+        """
+        now = time.monotonic()
+        if now - self._last_status_log >= _STATUS_LOG_INTERVAL:
+            self._last_status_log = now
+            _log.warning("%s: %s", label, status)
+
+    def iter_input_devices(self) -> Iterator[Optional[int]]:
+        """録音時に試行する入力デバイスを順に返す"""
+        return self._iter_devices(0, "max_input_channels")
+
+    def iter_output_devices(self) -> Iterator[Optional[int]]:
+        """再生時に試行する出力デバイスを順に返す"""
+        return self._iter_devices(1, "max_output_channels")
 
     def get_audio_devices(self) -> dict:
         """
@@ -38,7 +185,7 @@ class AudioService:
         input_devices: List[dict] = []
         output_devices: List[dict] = []
 
-        devices = sd.query_devices()
+        devices = self._get_devices_cached()
 
         for i, device in enumerate(devices):
             if device["max_input_channels"] > 0:
@@ -58,22 +205,31 @@ class AudioService:
                     }
                 )
 
-        default_input = sd.query_devices(kind="input")
-        default_output = sd.query_devices(kind="output")
+        # デフォルトデバイスの情報はキャッシュ済みの一覧から引く
+        default_input = None
+        default_output = None
+        try:
+            default_input_index, default_output_index = self._get_default_devices()
+            if 0 <= default_input_index < len(devices):
+                default_input = devices[default_input_index]
+            if 0 <= default_output_index < len(devices):
+                default_output = devices[default_output_index]
+        except Exception:
+            self._default_devices_cache = None
 
         return {
             "input_devices": input_devices,
             "output_devices": output_devices,
-            "default_input": default_input if len(default_input) > 0 else None,
-            "default_output": default_output if len(default_output) > 0 else None,
+            "default_input": default_input,
+            "default_output": default_output,
         }
 
-    def start_mic_monitoring(self, callback: Callable[[List[float]], None]) -> bool:
+    def start_mic_monitoring(self, callback: Callable[[np.ndarray], None]) -> bool:
         """
         マイクの監視を開始
 
         Args:
-            callback: 音声波形データを受け取るコールバック関数
+            callback: 音声波形データ（float32のnumpy配列）を受け取るコールバック関数
 
         Returns:
             開始成功時True
@@ -94,12 +250,12 @@ class AudioService:
             self.recording_thread.join(timeout=1.0)
         self.mic_callback = None
 
-    def start_speaker_monitoring(self, callback: Callable[[List[float]], None]) -> bool:
+    def start_speaker_monitoring(self, callback: Callable[[np.ndarray], None]) -> bool:
         """
         スピーカーの監視を開始（ループバック）
 
         Args:
-            callback: 音声波形データを受け取るコールバック関数
+            callback: 音声波形データ（float32のnumpy配列）を受け取るコールバック関数
 
         Returns:
             開始成功時True
@@ -109,6 +265,7 @@ class AudioService:
 
         self.speaker_callback = callback
         self.is_playing = True
+        self._speaker_wakeup.clear()
         self.playing_thread = threading.Thread(
             target=self._monitor_speaker, daemon=True
         )
@@ -118,6 +275,8 @@ class AudioService:
     def stop_speaker_monitoring(self) -> None:
         """スピーカーの監視を停止"""
         self.is_playing = False
+        # 待機中の監視スレッドをすぐに起こしてjoinを待たせない
+        self._speaker_wakeup.set()
         if self.playing_thread:
             self.playing_thread.join(timeout=1.0)
         self.speaker_callback = None
@@ -130,34 +289,15 @@ class AudioService:
         ) -> None:
             """sounddeviceのコールバック関数"""
             if status:
-                print(f"Audio callback status: {status}")
+                self._log_stream_status("Audio callback status", status)
             if self.mic_callback and self.is_recording:
-                # 正規化されたデータをリストに変換
+                # 正規化されたデータをnumpy配列のまま渡す
+                # （indataはコールバック終了後に再利用されるためコピーする）
                 audio_data = indata[:, 0] if indata.shape[1] > 0 else indata.flatten()
-                self.mic_callback(audio_data.tolist())
+                self.mic_callback(audio_data.copy())
 
-        # 試行するデバイスのリストを作成
-        candidate_devices = []
-
-        # 1. デフォルトデバイス
-        try:
-            if sd.default.device[0] >= 0:
-                candidate_devices.append(sd.default.device[0])
-        except Exception:
-            pass
-
-        # 2. その他の入力可能なデバイス
-        try:
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
-                if dev["max_input_channels"] > 0 and i not in candidate_devices:
-                    candidate_devices.append(i)
-        except Exception:
-            pass
-
-        # 最後にNoneを追加（デフォルトの挙動を試す）
-        if None not in candidate_devices:
-            candidate_devices.append(None)
+        # 試行するデバイス（一覧の取得はデフォルトデバイスが失敗した場合のみ）
+        candidate_devices = self.iter_input_devices()
 
         stream_opened = False
         last_error = None
@@ -167,7 +307,7 @@ class AudioService:
                 break
 
             try:
-                print(f"マイク監視を開始します (Device Index: {device_index})")
+                _log.info("マイク監視を開始します (Device Index: %s)", device_index)
                 with sd.InputStream(
                     samplerate=self.sample_rate,
                     channels=self.channels,
@@ -177,7 +317,8 @@ class AudioService:
                     device=device_index,
                 ):
                     stream_opened = True
-                    print(f"マイク監視中... (Device Index: {device_index})")
+                    self._remember_device(0, device_index)
+                    _log.info("マイク監視中... (Device Index: %s)", device_index)
                     while self.is_recording:
                         time.sleep(0.1)
 
@@ -186,17 +327,19 @@ class AudioService:
                     break
 
             except Exception as e:
-                print(f"デバイス {device_index} でのエラー: {str(e)}")
+                _log.warning("デバイス %s でのエラー: %s", device_index, e)
                 last_error = e
+                self._forget_device(0, device_index)
                 # ループを継続して次のデバイスを試す
                 if not self.is_recording:
                     break
                 time.sleep(0.2)
 
         if not stream_opened and self.is_recording:
-            print(
-                f"すべてのデバイスでマイク監視に失敗しました。最後のエラー: {str(last_error)}"
+            _log.error(
+                "すべてのデバイスでマイク監視に失敗しました。最後のエラー: %s", last_error
             )
+            self._invalidate_device_cache()
             self.is_recording = False
 
     def _monitor_speaker(self) -> None:
@@ -207,15 +350,15 @@ class AudioService:
             # WindowsではWASAPIループバックが利用可能
 
             while self.is_playing:
-                # ダミーデータを生成（実際の実装ではループバックストリームを使用）
-                dummy_data = [0.0] * self.chunk_size
-
+                # ダミーデータ（実際の実装ではループバックストリームを使用）
                 if self.speaker_callback:
-                    self.speaker_callback(dummy_data)
+                    self.speaker_callback(self._silence)
 
-                time.sleep(0.01)  # 10ms間隔
+                # 次のデータ（ループバック実装時）か停止を待つ。来なければ100ms間隔
+                if self._speaker_wakeup.wait(timeout=self._speaker_interval):
+                    self._speaker_wakeup.clear()
         except Exception as e:
-            print(f"スピーカー監視エラー: {str(e)}")
+            _log.error("スピーカー監視エラー: %s", e)
             self.is_playing = False
 
     def record_audio(self, duration: float = 3.0) -> np.ndarray:
@@ -228,43 +371,104 @@ class AudioService:
         Returns:
             録音された音声データ（numpy配列）
         """
-        # 試行するデバイスのリストを作成
-        candidate_devices = []
-        try:
-            if sd.default.device[0] >= 0:
-                candidate_devices.append(sd.default.device[0])
-        except Exception:
-            pass
-        try:
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
-                if dev["max_input_channels"] > 0 and i not in candidate_devices:
-                    candidate_devices.append(i)
-        except Exception:
-            pass
-        if None not in candidate_devices:
-            candidate_devices.append(None)
+        # 試行するデバイス（一覧の取得はデフォルトデバイスが失敗した場合のみ）
+        candidate_devices = self.iter_input_devices()
+        self._recording_stop.clear()
+        total_frames = int(duration * self.sample_rate)
 
         for device_index in candidate_devices:
             try:
-                print(f"録音を開始します (Device Index: {device_index})")
-                recording = sd.rec(
-                    int(duration * self.sample_rate),
-                    samplerate=self.sample_rate,
-                    channels=self.channels,
-                    dtype=self.dtype,
-                    device=device_index,
-                )
-                sd.wait()  # 録音が完了するまで待機
-                return recording.flatten()
+                _log.info("録音を開始します (Device Index: %s)", device_index)
+                recording = self._capture_stream(total_frames, device_index)
+                self._remember_device(0, device_index)
+                return recording
             except Exception as e:
-                print(f"録音エラー (Device {device_index}): {str(e)}")
+                _log.warning("録音エラー (Device %s): %s", device_index, e)
+                self._forget_device(0, device_index)
                 # 次のデバイスを試す
                 continue
 
-        print("すべてのデバイスで録音に失敗しました")
+        _log.error("すべてのデバイスで録音に失敗しました")
+        self._invalidate_device_cache()
         return np.array([], dtype=self.dtype)
 
+    async def record_audio_async(self, duration: float = 3.0) -> np.ndarray:
+        """
+        音声を録音する（録音完了を待つ間イベントループをブロックしない）
+
+        Args:
+            duration: 録音時間（秒）
+
+        Returns:
+            録音された音声データ（numpy配列）
+        """
+        return await asyncio.to_thread(self.record_audio, duration)
+
+    def _capture_stream(
+        self, total_frames: int, device_index: Optional[int]
+    ) -> np.ndarray:
+        """
+        InputStreamのコールバックで事前確保した配列に録音
+
+        録音完了（またはstop_recording）まで呼び出し元をブロックする。
+
+        Args:
+            total_frames: 録音するフレーム数
+            device_index: 入力デバイス番号（Noneの場合はデフォルト）
+
+        Returns:
+            録音された音声データ（途中で停止した場合はそこまで）
+
+        Raises:
+            TimeoutError: 録音時間＋猶予を過ぎても録音が完了しない場合
+                （ストリームは開けたがコールバックが来ないデバイスなど）
+        """
+        recording = np.empty(total_frames, dtype=self.dtype)
+        position = 0
+        finished = threading.Event()
+
+        def input_callback(
+            indata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags
+        ) -> None:
+            """sounddeviceの入力コールバック関数"""
+            nonlocal position
+            if status:
+                self._log_stream_status("Audio callback status", status)
+            count = min(frames, total_frames - position)
+            recording[position : position + count] = indata[:count, 0]
+            position += count
+            if position >= total_frames:
+                raise sd.CallbackStop
+
+        with sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=self.channels,
+            dtype=self.dtype,
+            blocksize=self.chunk_size,
+            callback=input_callback,
+            finished_callback=finished.set,
+            device=device_index,
+        ) as stream:
+            deadline = (
+                time.monotonic()
+                + total_frames / self.sample_rate
+                + _CAPTURE_TIMEOUT_MARGIN
+            )
+            while not finished.wait(timeout=0.1):
+                if self._recording_stop.is_set():
+                    break
+                if time.monotonic() >= deadline:
+                    stream.abort()
+                    raise TimeoutError(
+                        f"録音がタイムアウトしました ({position}/{total_frames} frames)"
+                    )
+
+        return recording[:position]
+
+    def stop_recording(self) -> None:
+        """record_audioによる録音を中断"""
+        self._recording_stop.set()
+
     def play_audio(
         self, audio_data: np.ndarray, volume_gain: float = 10.0
     ) -> Optional[np.ndarray]:
@@ -279,44 +483,92 @@ class AudioService:
             再生された音声データ（増幅後）またはNone（失敗時）
         """
         # 音量ゲインを適用（クリッピングを防ぐため-1.0～1.0の範囲に制限）
-        amplified = np.clip(audio_data * volume_gain, -1.0, 1.0)
-
-        # 試行するデバイスのリストを作成
-        candidate_devices = []
+        # 出力配列を1つだけ確保し、乗算とクリップをその中で行う
+        amplified = np.empty(np.shape(audio_data), dtype=self.dtype)
+        np.multiply(audio_data, volume_gain, out=amplified, casting="unsafe")
+        np.clip(amplified, -1.0, 1.0, out=amplified)
 
-        # 1. デフォルトデバイス
-        try:
-            if sd.default.device[1] >= 0:  # Output default
-                candidate_devices.append(sd.default.device[1])
-        except Exception:
-            pass
-
-        # 2. その他の出力可能なデバイス
-        try:
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
-                if dev["max_output_channels"] > 0 and i not in candidate_devices:
-                    candidate_devices.append(i)
-        except Exception:
-            pass
+        # 試行するデバイス（一覧の取得はデフォルトデバイスが失敗した場合のみ）
+        candidate_devices = self.iter_output_devices()
 
-        # 最後にNoneを追加（デフォルトの挙動を試す）
-        if None not in candidate_devices:
-            candidate_devices.append(None)
+        self._playback_stop.clear()
+        samples = amplified.reshape(-1)
 
         for device_index in candidate_devices:
             try:
-                print(f"再生を開始します (Device Index: {device_index})")
-                sd.play(amplified, samplerate=self.sample_rate, device=device_index)
-                sd.wait()  # 再生が完了するまで待機
+                _log.info("再生を開始します (Device Index: %s)", device_index)
+                self._play_stream(samples, device_index)
+                self._remember_device(1, device_index)
                 return amplified
             except Exception as e:
-                print(f"再生エラー (Device {device_index}): {str(e)}")
+                _log.warning("再生エラー (Device %s): %s", device_index, e)
+                self._forget_device(1, device_index)
                 continue
 
-        print("すべてのデバイスで再生に失敗しました")
+        _log.error("すべてのデバイスで再生に失敗しました")
+        self._invalidate_device_cache()
         return None
 
+    def _play_stream(self, samples: np.ndarray, device_index: Optional[int]) -> None:
+        """
+        OutputStreamのコールバックで音声をチャンクごとに書き出して再生
+
+        再生完了（またはstop_playback）まで呼び出し元をブロックする。
+
+        Args:
+            samples: 再生する1次元の音声データ
+            device_index: 出力デバイス番号（Noneの場合はデフォルト）
+
+        Raises:
+            TimeoutError: 再生時間＋猶予を過ぎても再生が完了しない場合
+                （ストリームは開けたがコールバックが来ないデバイスなど）
+        """
+        position = 0
+        finished = threading.Event()
+
+        def output_callback(
+            outdata: np.ndarray, frames: int, time_info: dict, status: sd.CallbackFlags
+        ) -> None:
+            """sounddeviceの出力コールバック関数"""
+            nonlocal position
+            if status:
+                self._log_stream_status("Audio output status", status)
+            chunk = samples[position : position + frames]
+            count = len(chunk)
+            outdata[:count, 0] = chunk
+            position += count
+            if count < frames:
+                # 末尾は無音で埋めて再生を終了する
+                outdata[count:] = 0
+                raise sd.CallbackStop
+
+        with sd.OutputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype=np.float32,
+            blocksize=self.chunk_size,
+            callback=output_callback,
+            finished_callback=finished.set,
+            device=device_index,
+        ) as stream:
+            deadline = (
+                time.monotonic()
+                + len(samples) / self.sample_rate
+                + _CAPTURE_TIMEOUT_MARGIN
+            )
+            while not finished.wait(timeout=0.1):
+                if self._playback_stop.is_set():
+                    break
+                if time.monotonic() >= deadline:
+                    stream.abort()
+                    raise TimeoutError(
+                        f"再生がタイムアウトしました ({position}/{len(samples)} samples)"
+                    )
+
+    def stop_playback(self) -> None:
+        """play_audioによる再生を中断"""
+        self._playback_stop.set()
+
     def __del__(self) -> None:
         """クリーンアップ"""
         self.stop_mic_monitoring()
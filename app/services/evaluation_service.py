@@ -5,6 +5,7 @@
 
 from typing import Dict, Any
 from datetime import datetime
+import asyncio
 import os
 from app.models.schemas import EvaluationResult
 from app.services.openai_service import OpenAIService
@@ -49,6 +50,20 @@ class EvaluationService:
             str, Any
         ] = await self.openai_service.evaluate_conversation(conversation_text)
 
+        return self._build_evaluation_result(conversation_evaluation)
+
+    def _build_evaluation_result(
+        self, conversation_evaluation: Dict[str, Any]
+    ) -> EvaluationResult:
+        """
+        会話内容評価の結果からEvaluationResultを作成
+
+        Args:
+            conversation_evaluation: OpenAIによる会話内容評価
+
+        Returns:
+            評価結果（EvaluationResultオブジェクト）
+        """
         # 結果を統合
         overall_score: float | None = None
         pronunciation_score: float | None = None
@@ -69,6 +84,39 @@ class EvaluationService:
             timestamp=datetime.now(),
         )
 
+    async def evaluate_and_predict(
+        self,
+        audio_data: bytes,
+        conversation_text: str,
+        listening_results: list[Dict[str, Any]],
+        grammar_results: list[Dict[str, Any]] | None = None,
+    ) -> tuple[EvaluationResult, Dict[str, Any]]:
+        """
+        会話評価と総合スコア予測を並行して実行
+
+        2つのAPI呼び出しは互いの結果に依存しないため同時に待ち、
+        所要時間を遅い方の応答時間に抑える。
+
+        Args:
+            audio_data: 音声データ（バイト列）
+            conversation_text: 会話テキスト
+            listening_results: リスニングテスト結果
+            grammar_results: 文法テスト結果（オプション）
+
+        Returns:
+            (評価結果, 予測スコア情報)
+        """
+        conversation_evaluation, predicted_result = await asyncio.gather(
+            self.openai_service.evaluate_conversation(conversation_text),
+            self.openai_service.predict_total_score(
+                conversation_text, listening_results, grammar_results
+            ),
+        )
+        return (
+            self._build_evaluation_result(conversation_evaluation),
+            predicted_result,
+        )
+
     async def predict_total_score(
         self,
         conversation_text: str,
@@ -2,53 +2,100 @@
 OpenAI APIサービス
 """
 
+import asyncio
 import os
-from openai import OpenAI
-from typing import Dict, Any
+from openai import AsyncOpenAI
+from typing import Awaitable, Dict, Any, TypeVar
 
+_T = TypeVar("_T")
 
-class OpenAIService:
-    """OpenAI APIを使用するサービスクラス"""
+# run_allで各リクエストを待つ上限（秒）
+_RUN_ALL_TIMEOUT: float = 60.0
 
-    def __init__(self) -> None:
-        """
-        初期化処理
-        環境変数からAPIキーを取得し、OpenAIクライアントを初期化する
-        """
-        # OPENAI_API_KEYまたはOPENAI_APIのどちらかをサポート
-        api_key: str | None = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API")
-        if not api_key:
-            raise ValueError(
-                "OPENAI_API_KEYまたはOPENAI_API環境変数が設定されていません"
-            )
-        self.client: OpenAI = OpenAI(api_key=api_key)
-        # 開発中はGPT-5 nano/miniを使用
-        self.model: str = os.getenv("OPENAI_MODEL", "gpt-5-nano")
+# Batch APIのジョブがこれ以上進まない状態
+_BATCH_TERMINAL_STATUSES: frozenset[str] = frozenset(
+    {"completed", "failed", "expired", "cancelled"}
+)
 
-    async def get_realtime_response(self, audio_data: bytes) -> str | None:
-        """
-        Realtime APIを使用して音声データから応答を取得
 
-        Args:
-            audio_data: 音声データ（バイト列）
+# リスニング問題（TOEIC Part 4形式）の生成プロンプト
+_LISTENING_PROMPT: str = """TOEICのPart 4: ロングセリフ（説明文）セクションのような英文と、それぞれの英文に対して2つの問題を生成してください。これを5セット（合計5つの英文と10問）生成してください。
+        生成された英文が被らないように多様なトピックを選び、"Welcome to ..."のような定型文は避けてください。
 
-        Returns:
-            AIからの応答テキスト、失敗時はNone
-        """
-        # TODO: Realtime APIの実装
-        pass
+        【重要：難易度設定】
+        各英文に対する2つの問題について、以下の難易度設定を厳守してください：
+        1問目：【低難易度 (Easy / CEFR A2-B1レベル)】
+          - テキスト内で明示的に述べられている事実やキーワードを聞き取るだけの単純な問題にしてください。
+          - 選択肢も単純で分かりやすいものにしてください。
+        2問目：【高難易度 (Hard / CEFR C1レベル)】
+          - 推論が必要な問題、言い換え（パラフレーズ）が多用されている問題、または文脈全体の理解が必要な問題にしてください。
+          - 語彙レベルを高くし、ひっかけの選択肢を含めてください。
 
-    async def evaluate_conversation(self, conversation_text: str) -> Dict[str, Any]:
+        【重要：長さの制限】
+        各英文の長さは、**80〜120単語程度**（読み上げ時間30〜45秒相当）にしてください。長すぎると受験者の負担になるため、適切な長さを厳守してください。
+
+        【重要：正解の分散】
+        正解の選択肢（A, B, C, D）は偏りがないようにランダムに分散させてください。すべての問題の答えが同じになったり、Bに偏ったりしないように、A, B, C, Dをバランスよく配置してください。
+        
+        以下のJSON形式で出力してください:
+        {
+            "passages": [
+                {
+                    "passage": "English passage text 1...",
+                    "problems": [
+                        {
+                            "question": "Question 1 (Easy)...",
+                            "options": ["Option A", "Option B", "Option C", "Option D"],
+                            "answer": "A" (A, B, C, or D)
+                        },
+                        {
+                            "question": "Question 2 (Hard)...",
+                            "options": ["Option A", "Option B", "Option C", "Option D"],
+                            "answer": "B" (A, B, C, or D)
+                        }
+                    ]
+                },
+                ... (repeat for 5 passages)
+            ]
+        }
         """
-        GPT-5を使用して会話内容を評価
 
-        Args:
-            conversation_text: 評価する会話テキスト（AIと学生の会話を交互に記録した形式）
+# 文法問題（TOEIC Part 5形式）の生成プロンプト
+_GRAMMAR_PROMPT: str = """TOEIC Part 5（短文穴埋め問題）形式の文法問題を5問生成してください。
+        文法知識（時制、品詞、関係詞、前置詞など）や語彙力を問う問題を作成してください。
 
-        Returns:
-            評価結果を含む辞書
+        【重要：難易度設定】
+        5問の中で難易度を分散させてください：
+        - 1-2問：【低難易度 (Basic)】基本的な文法事項（三単現のs、基本時制など）
+        - 2-3問：【中難易度 (Intermediate)】TOEIC 600点レベル（受動態、現在完了、接続詞など）
+        - 1-2問：【高難易度 (Advanced)】TOEIC 800点以上レベル（仮定法、倒置、難解な語彙など）
+
+        以下のJSON形式で出力してください:
+        {
+            "questions": [
+                {
+                    "question": "The manager _______ the report yesterday.",
+                    "options": ["writes", "wrote", "written", "writing"],
+                    "answer": "B" (A, B, C, or D),
+                    "explanation": "Yesterday（昨日）という過去を表す副詞があるため、過去形のwroteが正解です。"
+                },
+                ... (repeat for 5 questions)
+            ]
+        }
         """
-        prompt: str = f"""
+
+# リスニング問題と文法問題を1回のリクエストでまとめて生成するプロンプト
+_TEST_BUNDLE_PROMPT: str = (
+    "リスニング問題と文法問題を、以下の2つの指示に従って1つのJSONにまとめて生成してください。\n"
+    '出力は {"listening": <リスニング問題のJSON>, "grammar": <文法問題のJSON>} '
+    "の形式にしてください。\n\n"
+    "## リスニング問題\n" + _LISTENING_PROMPT + "\n\n"
+    "## 文法問題\n" + _GRAMMAR_PROMPT
+)
+
+
+# 会話評価プロンプト（会話テキストを挟んで連結する）
+_EVAL_PROMPT_HEAD: str = """
         あなたは厳格な英語会話評価官です。以下の英会話ログを評価してください。
 
         【重要：ハルシネーション（幻覚）と無音の検出について】
@@ -91,10 +138,11 @@ class OpenAIService:
         また、会話中に出てくる学習者にとって難しいと思われる単語や、重要な単語があれば抽出して解説してください。
         
         会話内容：
-        {conversation_text}
+        """
+_EVAL_PROMPT_TAIL: str = """
         
         評価結果を以下のJSON形式で返してください：
-        {{
+        {
             "is_valid": true/false,  // 会話として成立しているか（ハルシネーションのみの場合はfalse）
             "conversation_level": 1-10, // 会話レベル（1:初学者 - 10:ネイティブ級）
             "grammar_score": 0-100,  // 文法の正確性スコア
@@ -104,120 +152,274 @@ class OpenAIService:
             "overall_score": 0-100,  // 総合スコア（ハルシネーションのみなら0）
             "feedback": "評価コメント（無音の場合はその旨を記載）。レベル評価の理由も含めて記述してください。",
             "vocabulary_info": [
-                {{
+                {
                     "word": "単語",
                     "definition": "定義（日本語）",
                     "example": "例文"
-                }}
+                }
             ]
-        }}
+        }
         """
 
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an English conversation evaluation expert. Always respond in valid JSON format.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                response_format={"type": "json_object"},  # JSON形式で返すことを強制
+
+class OpenAIService:
+    """OpenAI APIを使用するサービスクラス"""
+
+    def __init__(self) -> None:
+        """
+        初期化処理
+        環境変数からAPIキーを取得し、OpenAIクライアントを初期化する
+        """
+        # OPENAI_API_KEYまたはOPENAI_APIのどちらかをサポート
+        api_key: str | None = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_API")
+        if not api_key:
+            raise ValueError(
+                "OPENAI_API_KEYまたはOPENAI_API環境変数が設定されていません"
             )
-            content: str | None = response.choices[0].message.content
-            if content:
-                import json
+        # 非同期クライアント（待機中もイベントループを止めず、接続プールを再利用する）
+        # httpxの接続はイベントループに紐づくため、呼び出しは同じループで行うこと
+        self.client: AsyncOpenAI = AsyncOpenAI(api_key=api_key)
+        # 開発中はGPT-5 nano/miniを使用
+        self.model: str = os.getenv("OPENAI_MODEL", "gpt-5-nano")
 
-                try:
-                    evaluation_data = json.loads(content)
+    async def get_realtime_response(self, audio_data: bytes) -> str | None:
+        """
+        Realtime APIを使用して音声データから応答を取得
 
-                    # レベル情報をフィードバックに追加（既存のスキーマを変更しないため）
-                    level = evaluation_data.get("conversation_level", 0)
-                    original_feedback = evaluation_data.get("feedback", "")
-                    enhanced_feedback = (
-                        f"**推定会話レベル: {level}/10**\n\n{original_feedback}"
-                    )
+        Args:
+            audio_data: 音声データ（バイト列）
 
-                    return {
-                        "evaluation": enhanced_feedback,
-                        "is_valid": evaluation_data.get("is_valid", False),
-                        "grammar_score": evaluation_data.get("grammar_score", 0),
-                        "vocabulary_score": evaluation_data.get("vocabulary_score", 0),
-                        "naturalness_score": evaluation_data.get(
-                            "naturalness_score", 0
-                        ),
-                        "fluency_score": evaluation_data.get("fluency_score", 0),
-                        "overall_score": evaluation_data.get("overall_score", 0),
-                        "vocabulary_info": evaluation_data.get("vocabulary_info", []),
-                    }
-                except json.JSONDecodeError:
-                    return {
-                        "evaluation": content,
-                        "is_valid": False,
-                        "error": "JSON解析エラー",
-                    }
-            return {"evaluation": "", "is_valid": False, "error": "レスポンスが空"}
+        Returns:
+            AIからの応答テキスト、失敗時はNone
+        """
+        # TODO: Realtime APIの実装
+        pass
+
+    async def evaluate_conversation(self, conversation_text: str) -> Dict[str, Any]:
+        """
+        GPT-5を使用して会話内容を評価
+
+        Args:
+            conversation_text: 評価する会話テキスト（AIと学生の会話を交互に記録した形式）
+
+        Returns:
+            評価結果を含む辞書
+        """
+        try:
+            response = await self.client.chat.completions.create(
+                **self._evaluation_request(conversation_text)
+            )
+            return self._parse_evaluation_content(response.choices[0].message.content)
         except Exception as e:
             return {"error": str(e), "is_valid": False}
 
-    async def create_listening_question(self) -> str:
+    def _evaluation_request(self, conversation_text: str) -> Dict[str, Any]:
         """
-        TOEIC Part 4形式のリスニング問題を生成
+        会話評価のChat Completionsリクエスト本文を作成
+
+        通常の呼び出しとBatch APIで同じ内容を送るために共通化している。
+
+        Args:
+            conversation_text: 評価する会話テキスト
 
         Returns:
-            生成された問題テキスト(JSON形式)
+            chat.completions.createに渡す引数の辞書
         """
-        prompt = """TOEICのPart 4: ロングセリフ（説明文）セクションのような英文と、それぞれの英文に対して2つの問題を生成してください。これを5セット（合計5つの英文と10問）生成してください。
-        生成された英文が被らないように多様なトピックを選び、"Welcome to ..."のような定型文は避けてください。
+        prompt = _EVAL_PROMPT_HEAD + conversation_text + _EVAL_PROMPT_TAIL
 
-        【重要：難易度設定】
-        各英文に対する2つの問題について、以下の難易度設定を厳守してください：
-        1問目：【低難易度 (Easy / CEFR A2-B1レベル)】
-          - テキスト内で明示的に述べられている事実やキーワードを聞き取るだけの単純な問題にしてください。
-          - 選択肢も単純で分かりやすいものにしてください。
-        2問目：【高難易度 (Hard / CEFR C1レベル)】
-          - 推論が必要な問題、言い換え（パラフレーズ）が多用されている問題、または文脈全体の理解が必要な問題にしてください。
-          - 語彙レベルを高くし、ひっかけの選択肢を含めてください。
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are an English conversation evaluation expert. Always respond in valid JSON format.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "response_format": {"type": "json_object"},  # JSON形式で返すことを強制
+        }
 
-        【重要：長さの制限】
-        各英文の長さは、**80〜120単語程度**（読み上げ時間30〜45秒相当）にしてください。長すぎると受験者の負担になるため、適切な長さを厳守してください。
+    def _parse_evaluation_content(self, content: str | None) -> Dict[str, Any]:
+        """
+        会話評価のレスポンス本文を評価結果の辞書に変換
 
-        【重要：正解の分散】
-        正解の選択肢（A, B, C, D）は偏りがないようにランダムに分散させてください。すべての問題の答えが同じになったり、Bに偏ったりしないように、A, B, C, Dをバランスよく配置してください。
-        
-        以下のJSON形式で出力してください:
-        {
-            "passages": [
+        Args:
+            content: モデルが返したJSON文字列
+
+        Returns:
+            評価結果を含む辞書
+        """
+        if content:
+            import json
+
+            try:
+                evaluation_data = json.loads(content)
+
+                # レベル情報をフィードバックに追加（既存のスキーマを変更しないため）
+                level = evaluation_data.get("conversation_level", 0)
+                original_feedback = evaluation_data.get("feedback", "")
+                enhanced_feedback = f"**推定会話レベル: {level}/10**\n\n{original_feedback}"
+
+                return {
+                    "evaluation": enhanced_feedback,
+                    "is_valid": evaluation_data.get("is_valid", False),
+                    "grammar_score": evaluation_data.get("grammar_score", 0),
+                    "vocabulary_score": evaluation_data.get("vocabulary_score", 0),
+                    "naturalness_score": evaluation_data.get("naturalness_score", 0),
+                    "fluency_score": evaluation_data.get("fluency_score", 0),
+                    "overall_score": evaluation_data.get("overall_score", 0),
+                    "vocabulary_info": evaluation_data.get("vocabulary_info", []),
+                }
+            except json.JSONDecodeError:
+                return {
+                    "evaluation": content,
+                    "is_valid": False,
+                    "error": "JSON解析エラー",
+                }
+        return {"evaluation": "", "is_valid": False, "error": "レスポンスが空"}
+
+    async def submit_batch_evaluations(self, conversations: list[str]) -> str:
+        """
+        複数の会話評価をBatch APIに登録（蓄積した会話の一括採点など即時性が不要な用途）
+
+        通常のリクエストと同じ内容をJSONLにまとめて送る。料金は通常の半額で、
+        分単位のリクエスト数制限も受けない。結果はfetch_batch_resultsで取得する。
+
+        Args:
+            conversations: 評価する会話テキストのリスト
+
+        Returns:
+            バッチID
+
+        Raises:
+            openai.OpenAIError: ファイルのアップロード・バッチの登録に失敗した場合
+                （登録できなかったことを呼び出し側で扱えるよう、他のメソッドと異なり
+                例外をそのまま送出する）
+        """
+        import json
+
+        lines = [
+            json.dumps(
                 {
-                    "passage": "English passage text 1...",
-                    "problems": [
-                        {
-                            "question": "Question 1 (Easy)...",
-                            "options": ["Option A", "Option B", "Option C", "Option D"],
-                            "answer": "A" (A, B, C, or D)
-                        },
-                        {
-                            "question": "Question 2 (Hard)...",
-                            "options": ["Option A", "Option B", "Option C", "Option D"],
-                            "answer": "B" (A, B, C, or D)
-                        }
-                    ]
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._evaluation_request(conversation_text),
                 },
-                ... (repeat for 5 passages)
-            ]
-        }
+                ensure_ascii=False,
+            )
+            for i, conversation_text in enumerate(conversations)
+        ]
+        payload = ("\n".join(lines) + "\n").encode("utf-8")
+
+        batch_file = await self.client.files.create(
+            file=("evaluations.jsonl", payload), purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        return batch.id
+
+    async def fetch_batch_results(
+        self, batch_id: str, poll_interval: float = 60.0
+    ) -> list[Dict[str, Any]]:
+        """
+        Batch APIのジョブ終了を待ち、会話評価の結果を取得
+
+        Args:
+            batch_id: submit_batch_evaluationsが返したバッチID
+            poll_interval: 状態を確認する間隔（秒）
+
+        Returns:
+            登録した順の評価結果のリスト（evaluate_conversationと同じ形式、
+            失敗した項目は"error"を含む）
+
+        Raises:
+            openai.OpenAIError: バッチの状態を取得できなかった場合
         """
+        batch = await self.client.batches.retrieve(batch_id)
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(poll_interval)
+            batch = await self.client.batches.retrieve(batch_id)
+
+        total = batch.request_counts.total if batch.request_counts else 0
+        results: list[Dict[str, Any]] = [
+            {
+                "error": f"結果を取得できませんでした（バッチの状態: {batch.status}）",
+                "is_valid": False,
+            }
+            for _ in range(total)
+        ]
+
+        # 成功したリクエストは出力ファイル、失敗したリクエストはエラーファイルに入る
+        # （完了したバッチでも失敗分は出力ファイルに含まれない。期限切れ・キャンセルでも
+        # 処理済みの分はどちらかに含まれる）
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            try:
+                file_content = await self.client.files.content(file_id)
+            except Exception as e:
+                print(f"バッチ結果ファイルの取得エラー: {e}")
+                continue
+            for line in file_content.text.splitlines():
+                if line:
+                    self._apply_batch_record(results, line)
+
+        return results
+
+    def _apply_batch_record(self, results: list[Dict[str, Any]], line: str) -> None:
+        """
+        Batch APIの結果ファイルの1行を評価結果のリストに反映
+
+        Args:
+            results: 登録した順の評価結果のリスト（該当する項目を書き換える）
+            line: 出力ファイルまたはエラーファイルの1行（JSON）
+        """
+        import json
 
         try:
-            response = self.client.chat.completions.create(
+            record = json.loads(line)
+            index = int(record["custom_id"])
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"バッチ結果の解析エラー: {e}")
+            return
+        if not 0 <= index < len(results):
+            return
+
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            results[index] = {
+                "error": str(record.get("error") or response.get("body")),
+                "is_valid": False,
+            }
+            return
+
+        try:
+            content = response["body"]["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError) as e:
+            results[index] = {"error": f"バッチ結果の形式が不正です: {e}", "is_valid": False}
+            return
+        results[index] = self._parse_evaluation_content(content)
+
+    async def create_listening_question(self) -> str:
+        """
+        TOEIC Part 4形式のリスニング問題を生成
+
+        Returns:
+            生成された問題テキスト(JSON形式)
+        """
+        try:
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
                         "content": "You are a helpful assistant that generates English listening tests in JSON format.",
                     },
-                    {"role": "user", "content": prompt},
+                    {"role": "user", "content": _LISTENING_PROMPT},
                 ],
                 response_format={"type": "json_object"},
             )
@@ -233,38 +435,15 @@ class OpenAIService:
         Returns:
             生成された問題テキスト(JSON形式)
         """
-        prompt = """TOEIC Part 5（短文穴埋め問題）形式の文法問題を5問生成してください。
-        文法知識（時制、品詞、関係詞、前置詞など）や語彙力を問う問題を作成してください。
-
-        【重要：難易度設定】
-        5問の中で難易度を分散させてください：
-        - 1-2問：【低難易度 (Basic)】基本的な文法事項（三単現のs、基本時制など）
-        - 2-3問：【中難易度 (Intermediate)】TOEIC 600点レベル（受動態、現在完了、接続詞など）
-        - 1-2問：【高難易度 (Advanced)】TOEIC 800点以上レベル（仮定法、倒置、難解な語彙など）
-
-        以下のJSON形式で出力してください:
-        {
-            "questions": [
-                {
-                    "question": "The manager _______ the report yesterday.",
-                    "options": ["writes", "wrote", "written", "writing"],
-                    "answer": "B" (A, B, C, or D),
-                    "explanation": "Yesterday（昨日）という過去を表す副詞があるため、過去形のwroteが正解です。"
-                },
-                ... (repeat for 5 questions)
-            ]
-        }
-        """
-
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
                         "role": "system",
                         "content": "You are a helpful assistant that generates English grammar tests in JSON format.",
                     },
-                    {"role": "user", "content": prompt},
+                    {"role": "user", "content": _GRAMMAR_PROMPT},
                 ],
                 response_format={"type": "json_object"},
             )
@@ -273,6 +452,89 @@ class OpenAIService:
             print(f"文法問題生成エラー: {e}")
             return ""
 
+    async def generate_test_bundle(self) -> Dict[str, Any]:
+        """
+        リスニング問題と文法問題を1回のリクエストでまとめて生成
+
+        両方のテストを行う場合に、システムプロンプトや接続のオーバーヘッドを
+        1回分にする。各部分はcreate_listening_question /
+        create_grammar_questionの戻り値と同じJSON文字列で返すため、
+        呼び出し側はそれらの代わりにそのまま使える。
+
+        Returns:
+            {"listening": "...", "grammar": "..."} 形式の辞書
+            （生成できなかった部分は含まない、失敗時は空の辞書）
+        """
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a helpful assistant that generates English listening and grammar tests in JSON format.",
+                    },
+                    {"role": "user", "content": _TEST_BUNDLE_PROMPT},
+                ],
+                response_format={"type": "json_object"},
+            )
+            content = response.choices[0].message.content
+            if not content:
+                return {}
+
+            import json
+
+            bundle = json.loads(content)
+        except Exception as e:
+            print(f"問題一括生成エラー: {e}")
+            return {}
+        if not isinstance(bundle, dict):
+            return {}
+
+        return {
+            key: json.dumps(section, ensure_ascii=False)
+            for key in ("listening", "grammar")
+            if isinstance(section := bundle.get(key), dict)
+        }
+
+    async def run_all(self, conversation_text: str) -> Dict[str, Any]:
+        """
+        互いに依存しないリクエスト（リスニング問題・文法問題の生成と会話評価）を並行実行
+
+        各リクエストは_RUN_ALL_TIMEOUT秒で打ち切り、1つが遅れても他の結果は返す。
+
+        Args:
+            conversation_text: 評価する会話テキスト
+
+        Returns:
+            "listening"・"grammar"・"evaluation"をキーとする辞書
+            （タイムアウトした項目はNone）
+        """
+        listening, grammar, evaluation = await asyncio.gather(
+            self._with_timeout(self.create_listening_question(), "リスニング問題生成"),
+            self._with_timeout(self.create_grammar_question(), "文法問題生成"),
+            self._with_timeout(
+                self.evaluate_conversation(conversation_text), "会話評価"
+            ),
+        )
+        return {"listening": listening, "grammar": grammar, "evaluation": evaluation}
+
+    async def _with_timeout(self, awaitable: Awaitable[_T], label: str) -> _T | None:
+        """
+        タイムアウト付きで待機し、タイムアウト時はNoneを返す
+
+        Args:
+            awaitable: 待機する処理
+            label: ログ出力用の処理名
+
+        Returns:
+            処理結果（タイムアウト時はNone）
+        """
+        try:
+            return await asyncio.wait_for(awaitable, timeout=_RUN_ALL_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"{label}がタイムアウトしました")
+            return None
+
     async def generate_speech(self, text: str, output_path: str) -> bool:
         """
         テキストから音声を生成して保存
@@ -286,12 +548,13 @@ class OpenAIService:
         """
         print(text)
         try:
-            response = self.client.audio.speech.create(
+            # 音声をメモリに溜めずにそのままファイルへ書き出す
+            async with self.client.audio.speech.with_streaming_response.create(
                 model="tts-1",
                 voice="alloy",
                 input=text,
-            )
-            response.stream_to_file(output_path)
+            ) as response:
+                await response.stream_to_file(output_path)
             return True
         except Exception as e:
             print(f"音声生成エラー: {e}")
@@ -369,7 +632,7 @@ class OpenAIService:
         """
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -374,12 +374,13 @@ class RealtimeService:
             if self.on_error:
                 self.on_error(error_msg)
 
-    def send_audio(self, audio_data: bytes) -> bool:
+    def send_audio(self, audio_data: bytes | bytearray | memoryview) -> bool:
         """
         音声データを送信
 
         Args:
-            audio_data: 音声データ（バイト列）
+            audio_data: 音声データ（16bit PCMのバイト列）。bytesに変換せず
+                memoryviewやC連続のint16配列をそのまま渡すこともできる
 
         Returns:
             送信成功時True、失敗時False
@@ -388,8 +389,8 @@ class RealtimeService:
             return False
 
         try:
-            # base64エンコード
-            audio_base64 = base64.b64encode(audio_data).decode("utf-8")
+            # base64エンコード（バッファプロトコル経由で読むためコピー不要）
+            audio_base64 = base64.b64encode(audio_data).decode("ascii")
 
             # イベントを送信
             self.session.send(
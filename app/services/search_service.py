@@ -5,7 +5,6 @@ DuckDuckGo Searchを使用してWeb検索を行う機能を提供します。
 
 from typing import List, Dict, Any
 import logging
-from duckduckgo_search import DDGS
 
 
 class SearchService:
@@ -30,6 +29,9 @@ class SearchService:
             print(f"検索実行: {query}")
             results = []
 
+            # 検索時に初めて読み込む（起動時のインポートコストを避ける）
+            from duckduckgo_search import DDGS
+
             # DDGSコンテキストマネージャーを使用
             with DDGS() as ddgs:
                 # テキスト検索を実行
@@ -0,0 +1,84 @@
+"""
+キュー経由のログ出力
+音声コールバックなど遅延させたくないスレッドではキューに積むだけにして、
+出力は別スレッドのリスナーで行う
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+# キューに溜められるログの上限（超えた分は捨てる）
+_QUEUE_MAX_SIZE: int = 1000
+
+# 1秒あたりに受け付けるログの上限（超えた分は捨てる）
+_MAX_RECORDS_PER_SECOND: int = 50
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """キューが満杯・流量超過のときはログを捨てるQueueHandler
+
+    呼び出し元（音声コールバック等）をブロックしたり、エラー出力したりしない。
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self._window_start: float = 0.0
+        self._window_count: int = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_count = 0
+        if self._window_count >= _MAX_RECORDS_PER_SECOND:
+            return
+        self._window_count += 1
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+_log_queue: queue.Queue = queue.Queue(maxsize=_QUEUE_MAX_SIZE)
+_handler = _DroppingQueueHandler(_log_queue)
+_listener: logging.handlers.QueueListener | None = None
+
+
+def get_queued_logger(name: str) -> logging.Logger:
+    """キュー経由で出力するロガーを取得
+
+    出力はstart_log_listener()で起動したリスナーが行う。
+    起動前のログはキューの上限まで溜めておく。
+
+    Args:
+        name: ロガー名
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    if _handler not in logger.handlers:
+        logger.addHandler(_handler)
+    return logger
+
+
+def start_log_listener() -> None:
+    """キューのログを標準出力に書き出すリスナーを起動（アプリ起動時に呼ぶ）"""
+    global _listener
+    if _listener is not None:
+        return
+    _listener = logging.handlers.QueueListener(
+        _log_queue, logging.StreamHandler(sys.stdout)
+    )
+    _listener.start()
+
+
+def stop_log_listener() -> None:
+    """リスナーを停止（アプリ終了時に呼ぶ、キューに残ったログは書き出す）"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
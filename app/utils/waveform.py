@@ -0,0 +1,48 @@
+"""
+波形チャート表示用のヘルパー
+ホーム画面と会話画面のリアルタイム波形で共用する
+"""
+
+from collections import deque
+import flet as ft
+import numpy as np
+from numpy.typing import NDArray
+
+# 波形チャートを再送する最小の変化量（これ未満の変化は見た目に現れないため送らない）
+WAVEFORM_PUSH_EPSILON: float = 1.0 / 256
+
+
+def normalize_levels(levels: deque[float], gain: float = 10.0) -> NDArray[np.float64]:
+    """音量レベルのバッファを波形チャート表示用の値に正規化する
+
+    値をgain倍して0.0〜1.0にクリップし、表示に必要な精度（小数第3位）に丸める。
+    丸めることでクライアントへ送るデータ量も減らす。
+    """
+    normalized = np.fromiter(levels, dtype=np.float64, count=len(levels))
+    normalized *= gain
+    np.clip(normalized, 0.0, 1.0, out=normalized)
+    np.round(normalized, 3, out=normalized)
+    return normalized
+
+
+def values_to_points(values: NDArray[np.floating]) -> list[ft.LineChartDataPoint]:
+    """正規化済みの値を波形チャート用のデータポイントに変換する"""
+    return [ft.LineChartDataPoint(i, v) for i, v in enumerate(values.tolist())]
+
+
+def level_buffer_to_points(
+    levels: deque[float], gain: float = 10.0
+) -> list[ft.LineChartDataPoint]:
+    """音量レベルのバッファを波形チャート用のデータポイントに変換する"""
+    return values_to_points(normalize_levels(levels, gain))
+
+
+def levels_unchanged(
+    last_levels: NDArray[np.float64] | None, levels: NDArray[np.float64]
+) -> bool:
+    """前回送信した波形からの変化が見た目に現れない程度かどうか（再送の省略判定用）"""
+    return (
+        last_levels is not None
+        and last_levels.shape == levels.shape
+        and bool(np.max(np.abs(levels - last_levels)) < WAVEFORM_PUSH_EPSILON)
+    )
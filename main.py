@@ -12,6 +12,7 @@ from app.gui.conversation_window import ConversationWindow
 from app.gui.result_window import ResultWindow
 from app.gui.history_window import HistoryWindow
 from app.config import APP_DATA_DIR
+from app.utils.log_queue import start_log_listener, stop_log_listener
 
 # 環境変数の読み込み
 from dotenv import load_dotenv
@@ -115,4 +116,9 @@ def main(page: ft.Page) -> None:
 
 
 if __name__ == "__main__":
-    ft.app(target=main, view=ft.AppView.FLET_APP)
+    # 音声処理のログはキュー経由で出力する（アプリ終了時に残りを書き出す）
+    start_log_listener()
+    try:
+        ft.app(target=main, view=ft.AppView.FLET_APP)
+    finally:
+        stop_log_listener()
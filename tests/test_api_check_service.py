@@ -13,6 +13,7 @@ class TestAPICheckService:
     @pytest.fixture
     def api_check_service(self):
         """APICheckServiceのインスタンスを作成"""
+        APICheckService.clear_cache()
         return APICheckService()
     
     @patch.dict(os.environ, {}, clear=True)
@@ -29,7 +30,7 @@ class TestAPICheckService:
     def test_check_openai_api_success(self, mock_openai, api_check_service):
         """OpenAI API接続成功のテスト"""
         mock_client = Mock()
-        mock_client.models.list.return_value = []
+        mock_client.models.retrieve.return_value = Mock()
         mock_openai.return_value = mock_client
         
         result = api_check_service.check_openai_api()
@@ -43,7 +44,7 @@ class TestAPICheckService:
     def test_check_openai_api_error(self, mock_openai, api_check_service):
         """OpenAI API接続エラーのテスト"""
         mock_client = Mock()
-        mock_client.models.list.side_effect = Exception("Connection error")
+        mock_client.models.retrieve.side_effect = Exception("Connection error")
         mock_openai.return_value = mock_client
         
         result = api_check_service.check_openai_api()
@@ -85,16 +86,70 @@ class TestAPICheckService:
         assert result["status"] == "エラー"
         assert "接続エラー" in result["message"]
     
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch('app.services.api_check_service.OpenAI')
+    def test_check_openai_api_cached(self, mock_openai, api_check_service):
+        """成功結果がキャッシュされ再リクエストしないことのテスト"""
+        mock_client = Mock()
+        mock_client.models.retrieve.return_value = Mock()
+        mock_openai.return_value = mock_client
+        
+        first = api_check_service.check_openai_api()
+        second = api_check_service.check_openai_api()
+        
+        assert first == second
+        assert mock_client.models.retrieve.call_count == 1
+    
+    @patch('app.services.api_check_service.OpenAI')
+    def test_get_client_reused(self, mock_openai, api_check_service):
+        """同じAPIキーではクライアントを再利用することのテスト"""
+        first = api_check_service._get_client("key_a")
+        second = api_check_service._get_client("key_a")
+        assert first is second
+        assert mock_openai.call_count == 1
+        
+        api_check_service._get_client("key_b")
+        assert mock_openai.call_count == 2
+    
     @patch.object(APICheckService, 'check_openai_api')
-    @patch.object(APICheckService, 'check_azure_speech_api')
-    def test_check_all_apis(self, mock_azure, mock_openai, api_check_service):
+    @patch.object(APICheckService, 'check_openrouter_api')
+    def test_check_api(self, mock_openrouter, mock_openai, api_check_service):
+        """API名を指定したチェックのテスト"""
+        mock_openai.return_value = {"name": "OpenAI API", "status": "利用可能"}
+        mock_openrouter.return_value = {"name": "OpenRouter API", "status": "不明"}
+        
+        assert api_check_service.check_api("OpenAI API")["status"] == "利用可能"
+        assert api_check_service.check_api("OpenRouter API")["status"] == "不明"
+        assert api_check_service.check_api("Unknown API")["status"] == "不明"
+    
+    @patch.object(APICheckService, 'check_openai_api')
+    @patch.object(APICheckService, 'check_openrouter_api')
+    def test_check_all_apis(self, mock_openrouter, mock_openai, api_check_service):
         """すべてのAPIチェックのテスト"""
         mock_openai.return_value = {"name": "OpenAI API", "status": "利用可能"}
-        mock_azure.return_value = {"name": "Azure Speech API", "status": "利用可能"}
+        mock_openrouter.return_value = {"name": "OpenRouter API", "status": "利用可能"}
         
         results = api_check_service.check_all_apis()
         
         assert len(results) == 2
+        assert [r["name"] for r in results] == ["OpenAI API", "OpenRouter API"]
         assert mock_openai.called
-        assert mock_azure.called
-
+        assert mock_openrouter.called
+    
+    @patch.object(APICheckService, 'CHECK_TIMEOUT', 0.1)
+    @patch.object(APICheckService, 'check_openai_api')
+    @patch.object(APICheckService, 'check_openrouter_api')
+    def test_check_all_apis_timeout(self, mock_openrouter, mock_openai, api_check_service):
+        """タイムアウトしたAPIが「不明」になることのテスト"""
+        import time
+        mock_openai.return_value = {"name": "OpenAI API", "status": "利用可能"}
+        mock_openrouter.side_effect = lambda: time.sleep(0.5) or {}
+        
+        results = api_check_service.check_all_apis()
+        
+        assert results[0]["status"] == "利用可能"
+        assert results[1] == {
+            "name": "OpenRouter API",
+            "status": "不明",
+            "message": "0.1秒以内に応答がありませんでした",
+        }
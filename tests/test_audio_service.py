@@ -52,6 +52,59 @@ class TestAudioService:
         assert 'default_input' in devices
         assert 'default_output' in devices
     
+    @patch('app.services.audio_service.sd.query_devices')
+    def test_get_devices_cached(self, mock_query_devices, audio_service):
+        """デバイス一覧がTTL内はキャッシュされることのテスト"""
+        mock_query_devices.return_value = [
+            {'name': 'Input Device', 'max_input_channels': 2, 'max_output_channels': 0},
+        ]
+        
+        first = audio_service._get_devices_cached()
+        second = audio_service._get_devices_cached()
+        
+        assert first is second
+        assert mock_query_devices.call_count == 1
+        
+        audio_service._invalidate_device_cache()
+        audio_service._get_devices_cached()
+        assert mock_query_devices.call_count == 2
+    
+    @patch('app.services.audio_service.sd.query_devices')
+    def test_iter_devices(self, mock_query_devices, audio_service):
+        """入力デバイス候補がデフォルト、対応デバイス、Noneの順になることのテスト"""
+        mock_query_devices.return_value = [
+            {'name': 'Output Device', 'max_input_channels': 0, 'max_output_channels': 2},
+            {'name': 'Input Device', 'max_input_channels': 2, 'max_output_channels': 0},
+            {'name': 'Both Device', 'max_input_channels': 2, 'max_output_channels': 2},
+        ]
+        audio_service._default_devices_cache = (2, 0)
+        
+        assert list(audio_service.iter_input_devices()) == [2, 1, None]
+        assert list(audio_service.iter_output_devices()) == [0, 2, None]
+    
+    @patch('app.services.audio_service.sd.query_devices')
+    def test_iter_devices_last_good_first(self, mock_query_devices, audio_service):
+        """前回成功したデバイスを最初に試すことのテスト"""
+        mock_query_devices.return_value = [
+            {'name': 'Input Device', 'max_input_channels': 2, 'max_output_channels': 0},
+            {'name': 'Both Device', 'max_input_channels': 2, 'max_output_channels': 2},
+        ]
+        audio_service._default_devices_cache = (0, 1)
+        
+        audio_service._remember_device(0, 1)
+        assert list(audio_service.iter_input_devices()) == [1, 0, None]
+        
+        audio_service._forget_device(0, 1)
+        assert list(audio_service.iter_input_devices()) == [0, 1, None]
+    
+    @patch('app.services.audio_service.sd.query_devices')
+    def test_iter_devices_default_first(self, mock_query_devices, audio_service):
+        """デフォルトデバイスのみ使う場合はデバイス一覧を取得しないことのテスト"""
+        audio_service._default_devices_cache = (3, 4)
+        
+        assert next(audio_service.iter_input_devices()) == 3
+        assert not mock_query_devices.called
+    
     def test_start_mic_monitoring(self, audio_service):
         """マイク監視開始のテスト"""
         callback = Mock()
@@ -116,52 +169,94 @@ class TestAudioService:
         assert audio_service.is_playing is False
         assert audio_service.speaker_callback is None
     
-    @patch('app.services.audio_service.sd.rec')
-    @patch('app.services.audio_service.sd.wait')
-    def test_record_audio(self, mock_wait, mock_rec, audio_service):
+    @patch('app.services.audio_service.sd.InputStream')
+    def test_record_audio(self, mock_input_stream, audio_service):
         """音声録音のテスト"""
-        mock_audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
-        mock_rec.return_value = mock_audio_data.reshape(-1, 1)
+        def open_stream(**kwargs):
+            # 1ブロックで録音が完了するストリーム
+            indata = np.full((44100, 1), 0.1, dtype=np.float32)
+            try:
+                kwargs["callback"](indata, 44100, None, None)
+            except Exception:
+                pass  # 録音完了時のCallbackStop
+            kwargs["finished_callback"]()
+            return MagicMock()
+        
+        mock_input_stream.side_effect = open_stream
         
         result = audio_service.record_audio(duration=1.0)
         
         assert isinstance(result, np.ndarray)
-        assert len(result) > 0
-        assert mock_rec.called
-        assert mock_wait.called
+        assert len(result) == 44100
+        assert mock_input_stream.called
     
-    @patch('app.services.audio_service.sd.rec')
-    @patch('app.services.audio_service.sd.wait')
-    def test_record_audio_error(self, mock_wait, mock_rec, audio_service):
+    @patch('app.services.audio_service.sd.InputStream')
+    def test_record_audio_error(self, mock_input_stream, audio_service):
         """録音エラーのテスト"""
-        mock_rec.side_effect = Exception("Recording error")
+        mock_input_stream.side_effect = Exception("Recording error")
         
         result = audio_service.record_audio(duration=1.0)
         
         assert isinstance(result, np.ndarray)
         assert len(result) == 0
     
-    @patch('app.services.audio_service.sd.play')
-    @patch('app.services.audio_service.sd.wait')
-    def test_play_audio(self, mock_wait, mock_play, audio_service):
+    @patch('app.services.audio_service._CAPTURE_TIMEOUT_MARGIN', 0.0)
+    @patch('app.services.audio_service.sd.InputStream')
+    def test_record_audio_timeout(self, mock_input_stream, audio_service):
+        """コールバックが来ないストリームでは録音を打ち切るテスト"""
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        mock_input_stream.return_value = stream
+        
+        with patch.object(audio_service, 'iter_input_devices', return_value=iter([None])):
+            result = audio_service.record_audio(duration=0.01)
+        
+        assert len(result) == 0
+        stream.abort.assert_called_once()
+    
+    @patch('app.services.audio_service._CAPTURE_TIMEOUT_MARGIN', 0.0)
+    @patch('app.services.audio_service.sd.OutputStream')
+    def test_play_audio_timeout(self, mock_output_stream, audio_service):
+        """コールバックが来ないストリームでは再生を打ち切るテスト"""
+        stream = MagicMock()
+        stream.__enter__.return_value = stream
+        mock_output_stream.return_value = stream
+        audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
+        
+        with patch.object(audio_service, 'iter_output_devices', return_value=iter([None])), \
+                patch.object(audio_service, '_forget_device') as mock_forget:
+            result = audio_service.play_audio(audio_data)
+        
+        assert result is None
+        stream.abort.assert_called_once()
+        mock_forget.assert_called_once_with(1, None)
+    
+    @patch('app.services.audio_service.sd.OutputStream')
+    def test_play_audio(self, mock_output_stream, audio_service):
         """音声再生のテスト"""
+        def open_stream(**kwargs):
+            # 再生完了を即座に通知するストリーム
+            kwargs["finished_callback"]()
+            return MagicMock()
+        
+        mock_output_stream.side_effect = open_stream
         audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         
-        audio_service.play_audio(audio_data, volume_gain=2.0)
+        result = audio_service.play_audio(audio_data, volume_gain=2.0)
         
-        assert mock_play.called
-        assert mock_wait.called
+        assert mock_output_stream.called
+        np.testing.assert_allclose(result, [0.2, 0.4, 0.6])
     
-    @patch('app.services.audio_service.sd.play')
-    @patch('app.services.audio_service.sd.wait')
-    def test_play_audio_error(self, mock_wait, mock_play, audio_service):
+    @patch('app.services.audio_service.sd.OutputStream')
+    def test_play_audio_error(self, mock_output_stream, audio_service):
         """再生エラーのテスト"""
-        mock_play.side_effect = Exception("Playback error")
+        mock_output_stream.side_effect = Exception("Playback error")
         audio_data = np.array([0.1, 0.2, 0.3], dtype=np.float32)
         
         # エラーが発生しても例外を投げないことを確認
         try:
-            audio_service.play_audio(audio_data)
+            result = audio_service.play_audio(audio_data)
         except Exception:
             pytest.fail("play_audio should not raise exceptions")
-
+        
+        assert result is None
@@ -127,22 +127,47 @@ class TestConversationWindow:
         """空のスコアチャート更新テスト"""
         conversation_window.score_chart = Mock()
         conversation_window.score_chart.data_series = [Mock() for _ in range(5)]
+        conversation_window.tabs = Mock(selected_index=1)  # 会話テストタブ
         conversation_window.evaluation_scores_history = []
         
         conversation_window._update_score_chart()
         
-        assert conversation_window.page.update.called
+        # UI更新はまとめて要求される
+        assert conversation_window.page.run_task.called
     
     def test_update_score_chart_with_data(self, conversation_window):
         """データがある場合のスコアチャート更新テスト"""
         conversation_window.score_chart = Mock()
         conversation_window.score_chart.data_series = [Mock() for _ in range(5)]
+        conversation_window.tabs = Mock(selected_index=1)  # 会話テストタブ
         conversation_window.evaluation_scores_history = [
             {"grammar": 85, "vocabulary": 80, "naturalness": 75, "fluency": 90, "overall": 82.5}
         ]
         
         conversation_window._update_score_chart()
         
-        assert conversation_window.page.update.called
+        assert conversation_window.page.run_task.called
         assert conversation_window.score_chart.data_series[0].data_points is not None
+    
+    def test_update_score_chart_hidden_tab(self, conversation_window):
+        """会話テストタブが非表示の場合はスコアチャート更新を保留するテスト"""
+        conversation_window.score_chart = Mock()
+        conversation_window.score_chart.data_series = [Mock() for _ in range(5)]
+        conversation_window.tabs = Mock(selected_index=0)  # メイン画面タブ
+        conversation_window.evaluation_scores_history = [
+            {"grammar": 85, "vocabulary": 80, "naturalness": 75, "fluency": 90, "overall": 82.5}
+        ]
+        
+        conversation_window._update_score_chart()
+        
+        assert not conversation_window.page.run_task.called
+        assert conversation_window.score_chart_dirty is True
+    
+    def test_request_update_coalesces(self, conversation_window):
+        """連続したUI更新要求が1回にまとめられるテスト"""
+        conversation_window._request_update()
+        conversation_window._request_update()
+        
+        assert conversation_window.page.run_task.call_count == 1
+        assert conversation_window.update_pending is True
 
@@ -128,3 +128,26 @@ class TestEvaluationService:
         assert result.pronunciation_score is None
         assert result.overall_score is None  # None値があるため計算されない
 
+    
+    @pytest.mark.asyncio
+    async def test_evaluate_and_predict(self, evaluation_service):
+        """会話評価と総合スコア予測を同時に実行"""
+        evaluation_service.openai_service.evaluate_conversation = AsyncMock(
+            return_value={"evaluation": "Good conversation"}
+        )
+        evaluation_service.openai_service.predict_total_score = AsyncMock(
+            return_value={"predicted_score": 700, "reasoning": "Solid"}
+        )
+        
+        result, predicted = await evaluation_service.evaluate_and_predict(
+            audio_data=b"dummy_audio",
+            conversation_text="AI「Hello」\n学生「Hi」",
+            listening_results=[],
+        )
+        
+        assert isinstance(result, EvaluationResult)
+        assert result.feedback == "Good conversation"
+        assert predicted["predicted_score"] == 700
+        evaluation_service.openai_service.predict_total_score.assert_awaited_once_with(
+            "AI「Hello」\n学生「Hi」", [], None
+        )
@@ -0,0 +1,46 @@
+"""
+キュー経由のログ出力のテスト
+"""
+
+import logging
+import queue
+from unittest.mock import patch
+from app.utils import log_queue
+from app.utils.log_queue import _DroppingQueueHandler
+
+
+class TestLogQueue:
+    """キュー経由のログ出力のテストクラス"""
+
+    @staticmethod
+    def _record(msg: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+    def test_drops_when_queue_full(self):
+        """キューが満杯のときは例外を出さずに捨てることのテスト"""
+        q: queue.Queue = queue.Queue(maxsize=2)
+        handler = _DroppingQueueHandler(q)
+
+        for i in range(5):
+            handler.handle(self._record(f"message {i}"))
+
+        assert q.qsize() == 2
+
+    def test_drops_over_rate_limit(self):
+        """1秒あたりの上限を超えたログを捨てることのテスト"""
+        q: queue.Queue = queue.Queue(maxsize=100)
+        handler = _DroppingQueueHandler(q)
+
+        with patch.object(log_queue, "_MAX_RECORDS_PER_SECOND", 3):
+            for i in range(10):
+                handler.handle(self._record(f"message {i}"))
+
+        assert q.qsize() == 3
+
+    def test_get_queued_logger_adds_handler_once(self):
+        """同じ名前で複数回取得してもハンドラが重複しないことのテスト"""
+        logger = log_queue.get_queued_logger("test.log_queue")
+        log_queue.get_queued_logger("test.log_queue")
+
+        assert logger.handlers.count(log_queue._handler) == 1
+        assert logger.propagate is False
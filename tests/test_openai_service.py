@@ -18,7 +18,7 @@ class TestOpenAIService:
         return Mock()
 
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     def test_init_success(self, mock_openai):
         """初期化成功のテスト"""
         mock_openai.return_value = Mock()
@@ -39,7 +39,7 @@ class TestOpenAIService:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     async def test_evaluate_conversation_success(self, mock_openai):
         """会話評価成功のテスト"""
         # モックレスポンスを設定
@@ -58,7 +58,7 @@ class TestOpenAIService:
         )
 
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         service = OpenAIService()
@@ -75,7 +75,7 @@ class TestOpenAIService:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     async def test_evaluate_conversation_json_error(self, mock_openai):
         """JSON解析エラーのテスト"""
         mock_response = Mock()
@@ -83,7 +83,7 @@ class TestOpenAIService:
         mock_response.choices[0].message.content = "Invalid JSON"
 
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         service = OpenAIService()
@@ -94,11 +94,11 @@ class TestOpenAIService:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     async def test_evaluate_conversation_api_error(self, mock_openai):
         """APIエラーのテスト"""
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(side_effect=Exception("API Error"))
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
         mock_openai.return_value = mock_client
 
         service = OpenAIService()
@@ -110,7 +110,7 @@ class TestOpenAIService:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     async def test_evaluate_conversation_with_vocabulary(self, mock_openai):
         """単語情報を含む会話評価成功のテスト"""
         # モックレスポンスを設定
@@ -136,7 +136,7 @@ class TestOpenAIService:
         )
 
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         service = OpenAIService()
@@ -150,7 +150,7 @@ class TestOpenAIService:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
-    @patch("app.services.openai_service.OpenAI")
+    @patch("app.services.openai_service.AsyncOpenAI")
     async def test_evaluate_conversation_empty_response(self, mock_openai):
         """空のレスポンスのテスト"""
         mock_response = Mock()
@@ -158,7 +158,7 @@ class TestOpenAIService:
         mock_response.choices[0].message.content = None
 
         mock_client = Mock()
-        mock_client.chat.completions.create = Mock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         mock_openai.return_value = mock_client
 
         service = OpenAIService()
@@ -167,3 +167,128 @@ class TestOpenAIService:
         assert "error" in result
         assert result["is_valid"] is False
         assert "レスポンスが空" in result["error"]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("app.services.openai_service.AsyncOpenAI")
+    async def test_generate_test_bundle(self, mock_openai):
+        """1回のリクエストで両方の問題をJSON文字列として返すことのテスト"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps(
+            {
+                "listening": {"passages": [{"passage": "Text", "problems": []}]},
+                "grammar": {"questions": [{"question": "Q", "answer": "A"}]},
+            }
+        )
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_openai.return_value = mock_client
+
+        service = OpenAIService()
+        bundle = await service.generate_test_bundle()
+
+        assert set(bundle) == {"listening", "grammar"}
+        assert json.loads(bundle["listening"])["passages"][0]["passage"] == "Text"
+        assert json.loads(bundle["grammar"])["questions"][0]["question"] == "Q"
+        assert mock_client.chat.completions.create.await_count == 1
+
+        # 一括生成の結果は保持されず、個別の生成は改めてリクエストする
+        await service.create_grammar_question()
+        assert mock_client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("app.services.openai_service.AsyncOpenAI")
+    async def test_run_all_partial_timeout(self, mock_openai):
+        """タイムアウトした項目だけNoneになることのテスト"""
+        import asyncio
+
+        mock_openai.return_value = Mock()
+        service = OpenAIService()
+
+        async def slow_grammar():
+            await asyncio.sleep(1)
+            return "late"
+
+        service.create_listening_question = AsyncMock(return_value="listening")
+        service.create_grammar_question = slow_grammar
+        service.evaluate_conversation = AsyncMock(return_value={"evaluation": "ok"})
+
+        with patch("app.services.openai_service._RUN_ALL_TIMEOUT", 0.1):
+            result = await service.run_all("AI「Hello」\n学生「Hi」")
+
+        assert result["listening"] == "listening"
+        assert result["grammar"] is None
+        assert result["evaluation"] == {"evaluation": "ok"}
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"})
+    @patch("app.services.openai_service.AsyncOpenAI")
+    async def test_batch_evaluations(self, mock_openai):
+        """Batch APIへの登録と結果取得のテスト"""
+        mock_client = Mock()
+        mock_client.files.create = AsyncMock(return_value=Mock(id="file-1"))
+        mock_client.batches.create = AsyncMock(return_value=Mock(id="batch-1"))
+        mock_client.batches.retrieve = AsyncMock(
+            return_value=Mock(
+                status="completed",
+                output_file_id="file-2",
+                error_file_id="file-3",
+                request_counts=Mock(total=3),
+            )
+        )
+        evaluation = {"is_valid": True, "overall_score": 7, "feedback": "良い"}
+        output_lines = [
+            {
+                "custom_id": "0",
+                "response": {
+                    "status_code": 200,
+                    "body": {
+                        "choices": [
+                            {"message": {"content": json.dumps(evaluation)}}
+                        ]
+                    },
+                },
+                "error": None,
+            },
+            # 形式が不正な行があっても他の結果は失われない
+            {"custom_id": "2", "response": {"status_code": 200, "body": {}}},
+        ]
+        # 失敗したリクエストは完了したバッチでもエラーファイルに入る
+        error_lines = [
+            {
+                "custom_id": "1",
+                "response": {"status_code": 500, "body": {"error": "server"}},
+                "error": None,
+            },
+        ]
+        file_texts = {
+            "file-2": "\n".join(json.dumps(l) for l in output_lines),
+            "file-3": "\n".join(json.dumps(l) for l in error_lines),
+        }
+        mock_client.files.content = AsyncMock(
+            side_effect=lambda file_id: Mock(text=file_texts[file_id])
+        )
+        mock_openai.return_value = mock_client
+        service = OpenAIService()
+
+        batch_id = await service.submit_batch_evaluations(
+            [
+                "AI「Hello」\n学生「Hi」",
+                "AI「Bye」\n学生「See you」",
+                "AI「Thanks」\n学生「OK」",
+            ]
+        )
+        results = await service.fetch_batch_results(batch_id, poll_interval=0)
+
+        assert batch_id == "batch-1"
+        _, payload = mock_client.files.create.call_args.kwargs["file"]
+        requests = [json.loads(l) for l in payload.decode("utf-8").splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[0]["url"] == "/v1/chat/completions"
+        assert len(results) == 3
+        assert results[0]["overall_score"] == 7
+        assert "server" in results[1]["error"]
+        assert results[2]["is_valid"] is False
@@ -0,0 +1,55 @@
+"""
+ResultWindowのテスト
+"""
+import pytest
+from unittest.mock import Mock
+import flet as ft
+from app.gui.result_window import ResultData, ResultWindow
+
+
+class TestResultData:
+    """ResultDataのテストクラス"""
+    
+    def test_from_dict(self):
+        """辞書からの作成テスト"""
+        data = ResultData.from_dict({
+            "grammar_score": 80,
+            "vocabulary_score": 75,
+            "naturalness_score": 70,
+            "fluency_score": 85,
+            "overall_score": 77.5,
+            "predicted_total_score": 650,
+            "feedback": "Good job",
+            "listening_score": 3,
+        })
+        
+        assert data.score_values == (80, 75, 70, 85, 77.5)
+        assert data.predicted_total_score == 650
+        assert data.feedback == "Good job"
+    
+    def test_from_dict_defaults(self):
+        """未設定・Noneの項目は既定値になるテスト"""
+        data = ResultData.from_dict({"grammar_score": 60, "feedback": None})
+        
+        assert data.score_values == (60, 0, 0, 0, 0)
+        assert data.predicted_total_score is None
+        assert data.feedback == "フィードバックがありません。"
+
+
+class TestResultWindow:
+    """ResultWindowのテストクラス"""
+    
+    @pytest.fixture
+    def mock_page(self):
+        """モックページを作成"""
+        page = Mock(spec=ft.Page)
+        page.controls = []
+        page.update = Mock()
+        return page
+    
+    def test_accepts_result_data(self, mock_page):
+        """ResultDataを渡して作成できるテスト"""
+        window = ResultWindow(mock_page, ResultData(overall_score=90))
+        
+        assert window.scores.overall_score == 90
+        assert window.result_data["overall_score"] == 90